@@ -16,7 +16,7 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 
-from .io import create_output_dir, save_json, save_yaml
+from .io import create_output_dir, load_radio_map_members, radio_map_exists, save_json, save_yaml
 from .simulate import run_simulation
 
 logger = logging.getLogger(__name__)
@@ -522,13 +522,13 @@ def _radio_map_entry_sample_at_position(
     if not isinstance(entry, dict):
         return None
     path = _radio_map_entry_data_path(output_dir, entry)
-    if not path.exists():
+    if not radio_map_exists(path):
         return None
     try:
-        with np.load(path) as data:
-            cell_centers = np.asarray(data["cell_centers"], dtype=float)
-            path_gain_db = np.asarray(data["path_gain_db"], dtype=float)
-            rx_power_dbm = np.asarray(data["rx_power_dbm"], dtype=float) if "rx_power_dbm" in data.files else None
+        members = load_radio_map_members(path, ("cell_centers", "path_gain_db", "rx_power_dbm"))
+        cell_centers = np.asarray(members["cell_centers"], dtype=float)
+        path_gain_db = np.asarray(members["path_gain_db"], dtype=float)
+        rx_power_dbm = np.asarray(members["rx_power_dbm"], dtype=float) if "rx_power_dbm" in members else None
     except Exception:
         return None
     if cell_centers.ndim < 3 or cell_centers.shape[-1] < 3 or path_gain_db.shape != cell_centers.shape[:2]:
@@ -7,11 +7,7 @@ import sys
 from pathlib import Path
 from typing import Any, Dict
 
-from .io import find_latest_output_dir
-from .plots import plot_radio_map_from_npz
-from .simulate import run_simulation
-from .campaign import run_campaign, run_absorber_sweep
-from .link_level import run_link_level_eval
+from .io import find_latest_output_dir, radio_map_exists
 from .utils.logging import setup_logging
 from .utils.system import print_diagnose_info
 
@@ -226,6 +222,8 @@ def main() -> None:
     args = _parse_args()
 
     if args.command == "run":
+        from .simulate import run_simulation
+
         overrides = _build_run_overrides(args)
         output_dir = run_simulation(args.config, overrides=overrides)
         logger.info("Outputs saved to %s", output_dir)
@@ -240,8 +238,8 @@ def main() -> None:
             output_dir = Path(args.output_dir)
 
         npz_path = output_dir / "data" / "radio_map.npz"
-        if not npz_path.exists():
-            raise SystemExit(f"radio_map.npz not found in {output_dir}")
+        if not radio_map_exists(npz_path):
+            raise SystemExit(f"radio_map.npz (or data/radio_map/ npy layout) not found in {output_dir}")
 
         plots_dir = output_dir / "plots"
         plots_dir.mkdir(parents=True, exist_ok=True)
@@ -250,6 +248,8 @@ def main() -> None:
             "rx_power_dbm": ("rx_power_dbm", "Rx power [dBm]", "radio_map_rx_power_dbm"),
             "path_loss_db": ("path_loss_db", "Path loss [dB]", "radio_map_path_loss_db"),
         }[args.metric]
+        from .plots import plot_radio_map_from_npz
+
         plot_radio_map_from_npz(npz_path, plots_dir, *metric_map)
         logger.info("Plots saved to %s", output_dir / "plots")
         return
@@ -259,6 +259,8 @@ def main() -> None:
         return
 
     if args.command == "campaign":
+        from .campaign import run_campaign, run_absorber_sweep
+
         if args.campaign_command == "run":
             output_dir = run_campaign(args.config)
             logger.info("Campaign outputs saved to %s", output_dir)
@@ -302,6 +304,8 @@ def main() -> None:
         return
 
     if args.command == "link":
+        from .link_level import run_link_level_eval
+
         if args.link_command == "eval":
             output_dir = run_link_level_eval(args.config)
             logger.info("Link-level outputs saved to %s", output_dir)
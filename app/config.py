@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
@@ -78,6 +80,11 @@ QUALITY_PRESETS = {
 }
 
 
+def compute_config_hash(config: Dict[str, Any]) -> str:
+    payload = json.dumps(config, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
 def load_config(path: str | Path) -> Config:
     path = Path(path)
     if not path.exists():
@@ -217,6 +217,8 @@ with tabs[4]:
 
 with tabs[5]:
     scene_png = plots_dir / "scene.png"
+    if not scene_png.exists():
+        scene_png = plots_dir / "scene.jpg"
     if scene_png.exists():
         st.image(str(scene_png), caption="Scene render", width="stretch")
         st.caption("Legend: red marker = transmitter (Tx), green marker = receiver (Rx).")
@@ -228,6 +230,7 @@ with tabs[6]:
         plot_png,
         plot_png.with_suffix(".svg"),
         plots_dir / "scene.png",
+        plots_dir / "scene.jpg",
         plots_dir / "path_delay_hist.png",
         plots_dir / "aoa_azimuth_hist.png",
         plots_dir / "aoa_elevation_hist.png",
@@ -235,6 +238,8 @@ with tabs[6]:
         data_dir / "radio_map.npz",
         data_dir / "ray_paths.csv",
         data_dir / "ray_paths.npz",
+        # output.radio_map_layout picks the binary form; missing files are skipped below.
+        data_dir / "ray_paths.npy",
     ]
     for file_path in download_files:
         if file_path.exists():
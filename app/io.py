@@ -1,7 +1,8 @@
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import yaml
 import numpy as np
@@ -50,3 +51,121 @@ def _json_default(obj: Any):
 def save_json(path: Path, data: Dict[str, Any]) -> None:
     with path.open("w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, default=_json_default)
+
+
+NPZ_COMPRESSION_MODES = ("none", "deflate")
+
+
+def save_npz(path: Path, compression: str = "none", **arrays: Any) -> None:
+    """Save arrays as .npz; ``deflate`` trades zlib CPU time for smaller files."""
+    if compression not in NPZ_COMPRESSION_MODES:
+        raise ValueError(f"Unknown npz compression: {compression} (expected one of {NPZ_COMPRESSION_MODES})")
+    if compression == "deflate":
+        np.savez_compressed(path, **arrays)
+    else:
+        np.savez(path, **arrays)
+
+
+def save_npy_dir(directory: Path, **arrays: Any) -> None:
+    """Save each array as ``<name>.npy`` (loadable with ``mmap_mode="r"``) plus a manifest.json."""
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for name, value in arrays.items():
+        arr = np.asarray(value)
+        np.save(directory / f"{name}.npy", arr)
+        manifest[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape)}
+    save_json(directory / "manifest.json", manifest)
+
+
+def radio_map_exists(npz_path: Path) -> bool:
+    """True if ``npz_path`` or its ``output.radio_map_layout: npy`` directory twin exists."""
+    return npz_path.exists() or (npz_path.with_suffix("") / "cell_centers.npy").exists()
+
+
+def load_radio_map_arrays(
+    npz_path: Path,
+    value_keys: Sequence[str],
+) -> tuple[Optional[str], Optional[np.ndarray], Optional[np.ndarray]]:
+    """Return ``(key, values, cell_centers)`` for the first of ``value_keys`` present.
+
+    The ``output.radio_map_layout: npy`` directory next to the .npz is memory-mapped
+    when present; otherwise only the chosen member and cell_centers are read from the
+    .npz rather than every array in it.
+    """
+    npy_dir = npz_path.with_suffix("")
+    centers_npy = npy_dir / "cell_centers.npy"
+    if centers_npy.exists():
+        for key in value_keys:
+            values_npy = npy_dir / f"{key}.npy"
+            if values_npy.exists():
+                return key, np.load(values_npy, mmap_mode="r"), np.load(centers_npy, mmap_mode="r")
+    if npz_path.exists():
+        with np.load(npz_path) as npz:
+            members = set(npz.files)
+            key = next((k for k in value_keys if k in members), None)
+            if key is not None and "cell_centers" in members:
+                return key, npz[key], npz["cell_centers"]
+    return None, None, None
+
+
+def load_radio_map_members(npz_path: Path, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Return every one of ``keys`` present in the radio map, opening the npz or npy layout once.
+
+    Like :func:`load_radio_map_arrays`, the npy directory is preferred and memory-mapped.
+    """
+    npy_dir = npz_path.with_suffix("")
+    if (npy_dir / "cell_centers.npy").exists():
+        return {
+            key: np.load(npy_dir / f"{key}.npy", mmap_mode="r")
+            for key in keys
+            if (npy_dir / f"{key}.npy").exists()
+        }
+    if npz_path.exists():
+        with np.load(npz_path) as npz:
+            members = set(npz.files)
+            return {key: npz[key] for key in keys if key in members}
+    return {}
+
+
+def save_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Replace ``path`` in one rename so pollers never read a half-written file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, default=_json_default), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def save_csv(
+    path: Path,
+    data: np.ndarray | Sequence[np.ndarray],
+    header: str,
+    fmt: Sequence[str],
+    chunk_rows: int = 8192,
+) -> None:
+    """Write numeric rows as CSV, formatting one tile of rows per call.
+
+    ``data`` is either a 2-D array or a sequence of column blocks (1-D or 2-D)
+    that share a row count; blocks are stacked one tile at a time so the full
+    table is never materialized.
+    """
+    blocks = [data] if isinstance(data, np.ndarray) else list(data)
+    blocks = [np.asarray(block) for block in blocks]
+    blocks = [block.reshape(-1, 1) if block.ndim == 1 else block for block in blocks]
+    num_rows = blocks[0].shape[0] if blocks else 0
+    chunk_rows = max(int(chunk_rows), 1)
+    row_fmt = ",".join(fmt) + "\n"
+    with path.open("w", encoding="utf-8") as f:
+        f.write(header + "\n")
+        if num_rows == 0:
+            return
+        # One tile buffer is reused for every chunk, so peak extra memory is chunk_rows rows.
+        num_cols = sum(block.shape[1] for block in blocks)
+        tile_buf = np.empty((min(chunk_rows, num_rows), num_cols), dtype=np.result_type(*blocks))
+        for start in range(0, num_rows, chunk_rows):
+            stop = min(start + chunk_rows, num_rows)
+            tile = tile_buf[: stop - start]
+            col = 0
+            for block in blocks:
+                tile[:, col : col + block.shape[1]] = block[start:stop]
+                col += block.shape[1]
+            if tile.size:
+                f.write((row_fmt * tile.shape[0]) % tuple(tile.ravel().tolist()))
@@ -6,10 +6,12 @@ import numpy as np
 
 
 def _to_numpy(x):
-    try:
-        return x.numpy()
-    except AttributeError:
-        return np.asarray(x)
+    if isinstance(x, np.ndarray):
+        return x
+    to_numpy = getattr(x, "numpy", None)
+    if to_numpy is not None:
+        return to_numpy()
+    return np.asarray(x)
 
 
 def _paths_coefficients(paths) -> np.ndarray:
@@ -20,6 +22,21 @@ def _paths_coefficients(paths) -> np.ndarray:
     return _to_numpy(a)
 
 
+def _paths_power(paths) -> np.ndarray:
+    """|a|^2 per coefficient, computed as re^2 + im^2 (no sqrt, no complex temporary)."""
+    a = paths.a
+    if isinstance(a, (tuple, list)) and len(a) == 2:
+        a_real, a_imag = (np.asarray(_to_numpy(part)) for part in a)
+    else:
+        a = np.asarray(_to_numpy(a))
+        if not np.iscomplexobj(a):
+            return np.square(a)
+        a_real, a_imag = a.real, a.imag
+    power = np.square(a_real)
+    power += np.square(a_imag)
+    return power
+
+
 def _paths_mask(paths) -> Optional[np.ndarray]:
     for attr in ("valid", "mask", "targets_sources_mask"):
         if hasattr(paths, attr):
@@ -54,12 +71,14 @@ def _mask_any_per_path(mask: Optional[np.ndarray]) -> Optional[np.ndarray]:
     return mask.reshape(-1, mask.shape[-1]).any(axis=0)
 
 
-def _per_path_power_and_valid(paths) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
-    try:
-        a = _paths_coefficients(paths)
-    except Exception:
-        return None, None
-    power = np.abs(a) ** 2
+def _per_path_power_and_valid(
+    paths, power: Optional[np.ndarray] = None
+) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    if power is None:
+        try:
+            power = _paths_power(paths)
+        except Exception:
+            return None, None
     types = _path_types(paths)
     num_paths = int(types.shape[-1]) if types is not None and types.size > 0 else None
     if num_paths is None and power.ndim >= 1:
@@ -128,8 +147,10 @@ def _path_power_by_ris_objects(
     }
 
 
-def _path_power_by_type(paths, scene: Optional[Any] = None) -> Optional[Dict[str, float]]:
-    per_path, valid = _per_path_power_and_valid(paths)
+def _path_power_by_type(
+    paths, scene: Optional[Any] = None, power: Optional[np.ndarray] = None
+) -> Optional[Dict[str, float]]:
+    per_path, valid = _per_path_power_and_valid(paths, power=power)
     if per_path is None or valid is None:
         return None
 
@@ -237,10 +258,9 @@ def _count_ris_paths(paths, scene: Optional[Any] = None) -> Optional[int]:
 
 def compute_path_metrics(paths, tx_power_dbm: float, scene: Optional[Any] = None) -> Dict[str, Any]:
     """Compute simple, report-friendly metrics from Sionna RT Paths."""
-    a = _paths_coefficients(paths)
-
     # Sum over all paths and antennas to get a total path gain proxy.
-    power_linear = np.abs(a) ** 2
+    # The same |a|^2 array feeds the per-type split below.
+    power_linear = _paths_power(paths)
     total_path_gain_linear = float(power_linear.sum())
     total_path_gain_db = 10.0 * np.log10(total_path_gain_linear + 1e-12)
 
@@ -254,7 +274,7 @@ def compute_path_metrics(paths, tx_power_dbm: float, scene: Optional[Any] = None
         "rx_power_dbm_estimate": tx_power_dbm + total_path_gain_db,
         "num_valid_paths": num_valid_paths,
     }
-    type_power = _path_power_by_type(paths, scene=scene)
+    type_power = _path_power_by_type(paths, scene=scene, power=power_linear)
     if type_power:
         ris_power = type_power["ris_power_linear"]
         non_ris_power = type_power["non_ris_power_linear"]
@@ -278,8 +298,7 @@ def compute_path_metrics(paths, tx_power_dbm: float, scene: Optional[Any] = None
 
 def extract_path_data(paths) -> Dict[str, Any]:
     """Extract per-path arrays for plotting and advanced metrics."""
-    a = _paths_coefficients(paths)
-    power = np.abs(a) ** 2
+    power = _paths_power(paths)
     if power.ndim < 1:
         return {
             "delays_s": np.array([]),
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 import matplotlib
 matplotlib.use("Agg")
+import matplotlib.image
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 import numpy as np
 
-
-def _load_npz(path: Path) -> Dict[str, Any]:
-    with np.load(path) as data:
-        return {k: data[k] for k in data.files}
+from .io import load_radio_map_arrays
 
 
 def _infer_cell_size(cell_centers: np.ndarray) -> Tuple[float, float]:
@@ -198,6 +198,42 @@ def plot_radio_map(
     return png_path, svg_path
 
 
+def plot_radio_map_raster(
+    metric_map: np.ndarray,
+    output_dir: Path,
+    filename_prefix: str,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    cmap: str = "viridis",
+) -> Path:
+    """Write the grid as a colormapped PNG, one pixel per cell, without axes or colorbar."""
+    data = metric_map[0] if metric_map.ndim == 3 else metric_map
+    png_path = output_dir / f"{filename_prefix}.png"
+    matplotlib.image.imsave(png_path, data, cmap=cmap, vmin=vmin, vmax=vmax, origin="lower")
+    return png_path
+
+
+def _plot_worker_init() -> None:
+    matplotlib.use("Agg")
+
+
+def plot_radio_map_batch(jobs: List[Dict[str, Any]], max_workers: int = 1) -> List[Tuple[Path, Path]]:
+    """Render several plot_radio_map calls, optionally in worker processes.
+
+    Workers are spawned rather than forked so they never inherit CUDA/Dr.Jit state.
+    """
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [plot_radio_map(**job) for job in jobs]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(jobs)),
+        mp_context=ctx,
+        initializer=_plot_worker_init,
+    ) as executor:
+        futures = [executor.submit(plot_radio_map, **job) for job in jobs]
+        return [future.result() for future in futures]
+
+
 def plot_radio_map_sionna(
     coverage_map: Any,
     output_dir: Path,
@@ -240,10 +276,12 @@ def plot_radio_map_from_npz(
     metric_label: str,
     filename_prefix: str,
 ) -> Tuple[Path, Path]:
-    data = _load_npz(npz_path)
+    _, values, cell_centers = load_radio_map_arrays(npz_path, (metric_key,))
+    if values is None:
+        raise KeyError(f"{metric_key} not found in {npz_path}")
     return plot_radio_map(
-        metric_map=data[metric_key],
-        cell_centers=data["cell_centers"],
+        metric_map=np.asarray(values),
+        cell_centers=np.asarray(cell_centers),
         output_dir=output_dir,
         metric_label=metric_label,
         filename_prefix=filename_prefix,
@@ -15,7 +15,7 @@ from typing import Any, Dict, Optional
 import numpy as np
 
 from app.config import load_config
-from app.io import save_json, save_yaml
+from app.io import load_radio_map_arrays, radio_map_exists, save_csv, save_json, save_yaml
 from app.radio_map_grid import align_center_to_anchor
 from app.ris.rt_synthesis_artifacts import (
     write_cdf_plot,
@@ -54,7 +54,7 @@ from app.ris.rt_synthesis_roi import (
     coverage_plane_metadata_from_seed_cfg,
 )
 from app.scene import build_scene
-from app.simulate import _rt_backend_from_variant
+from app.simulate import _derive_radio_map_metrics, _rt_backend_from_variant
 from app.utils.system import (
     collect_environment_info,
     configure_tensorflow_for_mitsuba_variant,
@@ -179,9 +179,9 @@ def _infer_fixed_plane_from_cell_centers(seed_cfg: dict, cell_centers: Any) -> d
 
 def _load_seed_run_cell_centers(seed_run_dir: Path) -> Optional[np.ndarray]:
     npz_path = seed_run_dir / "data" / "radio_map.npz"
-    if npz_path.exists():
-        with np.load(npz_path) as payload:
-            centers = payload.get("cell_centers")
+    if radio_map_exists(npz_path):
+        # Asking for cell_centers as the value key returns it from either radio-map layout.
+        _, centers, _ = load_radio_map_arrays(npz_path, ("cell_centers",))
         if centers is not None:
             return np.asarray(centers, dtype=float)
     viewer_json = seed_run_dir / "viewer" / "heatmap.json"
@@ -298,16 +298,15 @@ def _coverage_kwargs(seed_cfg: dict, plane: dict, *, ris_enabled: bool) -> dict:
 
 
 def _result_to_arrays(result: Any, tx_power_dbm: float) -> dict:
-    path_gain = _to_numpy(result.path_gain)
+    path_gain = result.path_gain
+    path_gain_linear = _to_numpy(path_gain[0] if len(path_gain.shape) == 3 else path_gain)
     cell_centers = _to_numpy(result.cell_centers)
-    path_gain_linear = path_gain[0] if path_gain.ndim == 3 else path_gain
-    path_gain_db = 10.0 * np.log10(path_gain_linear + 1.0e-12)
-    rx_power_dbm = float(tx_power_dbm) + path_gain_db
+    path_gain_db, rx_power_dbm, path_loss_db, _ = _derive_radio_map_metrics(path_gain_linear, float(tx_power_dbm))
     return {
         "path_gain_linear": path_gain_linear,
         "path_gain_db": path_gain_db,
         "rx_power_dbm": rx_power_dbm,
-        "path_loss_db": -path_gain_db,
+        "path_loss_db": path_loss_db,
         "cell_centers": cell_centers,
     }
 
@@ -336,15 +335,11 @@ def _write_default_radio_map_artifacts(
         cell_centers=cell_centers,
     )
 
-    flat_gain = path_gain_db.reshape(-1)
-    flat_centers = cell_centers.reshape(-1, 3)
-    csv_data = np.column_stack([flat_centers, flat_gain])
-    np.savetxt(
+    save_csv(
         data_dir / "radio_map.csv",
-        csv_data,
-        delimiter=",",
+        [cell_centers.reshape(-1, 3), path_gain_db.reshape(-1)],
         header="x,y,z,path_gain_db",
-        comments="",
+        fmt=["%.9g"] * 4,
     )
 
     if diff_vs_off is not None:
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import contextlib
-import hashlib
-import json
+import csv
+import functools
 import logging
 import math
+import re
+import sys
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import numpy as np
 
-from .config import load_config
+from .config import compute_config_hash, load_config
 from .sim_tuning import apply_similarity_and_sampling
 from .radio_map_grid import (
     align_center_to_anchor,
@@ -21,9 +23,25 @@ from .radio_map_grid import (
     radio_map_z_slice_offsets,
 )
 from .ris.ris_geometry import apply_ris_geometry_overrides
-from .io import create_output_dir, save_json, save_yaml
+from .io import (
+    NPZ_COMPRESSION_MODES,
+    create_output_dir,
+    save_csv,
+    save_json,
+    save_json_atomic,
+    save_npy_dir,
+    save_npz,
+    save_yaml,
+)
 from .metrics import build_paths_table, compute_path_metrics, extract_path_data
-from .plots import plot_radio_map, plot_radio_map_sionna, plot_histogram, plot_rays_3d
+from .plots import (
+    plot_histogram,
+    plot_radio_map,
+    plot_radio_map_batch,
+    plot_radio_map_raster,
+    plot_radio_map_sionna,
+    plot_rays_3d,
+)
 from .viewer import generate_viewer
 from .scene import (
     build_scene,
@@ -38,6 +56,7 @@ from .utils.system import (
     configure_tensorflow_memory_growth,
     configure_tensorflow_for_mitsuba_variant,
     select_mitsuba_variant,
+    start_tensorflow_import,
     assert_mitsuba_variant,
     collect_environment_info,
     disable_pythreejs_import,
@@ -47,10 +66,24 @@ logger = logging.getLogger(__name__)
 
 
 def _to_numpy(x):
-    try:
-        return x.numpy()
-    except AttributeError:
-        return np.asarray(x)
+    if isinstance(x, np.ndarray):
+        return x
+    to_numpy = getattr(x, "numpy", None)
+    if to_numpy is not None:
+        return to_numpy()
+    return np.asarray(x)
+
+
+# Extensions Mitsuba's bitmap writer encodes for scene.render_to_file; jpg skips PNG's DEFLATE pass.
+_RENDER_FORMATS = {"png", "jpg"}
+
+
+@functools.cache
+def _sionna_camera_cls() -> Any:
+    # Deferred until after Mitsuba variant selection; cached for repeated runs in one process.
+    from sionna.rt import Camera
+
+    return Camera
 
 
 def _to_vec3(value: Any) -> Optional[np.ndarray]:
@@ -126,21 +159,35 @@ def _ray_path_front_filter_enabled(cfg: Dict[str, Any], vis_cfg: Dict[str, Any])
     return bool(horn_spec and horn_spec.get("front_only"))
 
 
-def _path_is_valid(valid_mask: np.ndarray, path_index: int) -> bool:
+def _valid_path_indices(valid_mask: np.ndarray, num_paths: int) -> np.ndarray:
     valid = np.asarray(valid_mask, dtype=bool)
     if valid.size == 0:
-        return True
+        return np.arange(num_paths)
     if valid.ndim == 0:
-        return bool(valid.item())
-    if valid.shape[-1] <= path_index:
-        return False
-    return bool(valid.reshape(-1, valid.shape[-1])[:, path_index].any())
+        return np.arange(num_paths) if valid.item() else np.zeros((0,), dtype=int)
+    per_path = valid.reshape(-1, valid.shape[-1]).any(axis=0)[:num_paths]
+    return np.flatnonzero(per_path)
+
+
+def _gather_first_link_paths(values: Any, indices: np.ndarray) -> np.ndarray:
+    """Return ``values[:, 0, 0, indices]`` on host, gathering on device first when possible."""
+    if isinstance(values, np.ndarray) or not hasattr(values, "numpy"):
+        return np.asarray(values)[:, 0, 0, indices]
+    tf = sys.modules.get("tensorflow")
+    if tf is None:
+        return _to_numpy(values)[:, 0, 0, indices]
+    return tf.gather(values[:, 0, 0], indices, axis=1).numpy()
+
+
+def _num_elements(values: Any) -> int:
+    return int(np.prod(values.shape))
 
 
 def _extract_ray_path_segments(paths: Any, cfg: Dict[str, Any], vis_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    verts = _to_numpy(paths.vertices)
-    interactions = _to_numpy(getattr(paths, "interactions", np.array([])))
-    objects = _to_numpy(getattr(paths, "objects", np.array([])))
+    # Vertices/interactions stay on device until the valid-path gather below.
+    verts = paths.vertices
+    interactions = getattr(paths, "interactions", np.array([]))
+    objects = getattr(paths, "objects", np.array([]))
     valid = _to_numpy(getattr(paths, "targets_sources_mask", getattr(paths, "mask", np.array([])))).astype(bool)
     sources = _to_numpy(paths.sources)
     targets = _to_numpy(paths.targets)
@@ -156,27 +203,29 @@ def _extract_ray_path_segments(paths: Any, cfg: Dict[str, Any], vis_cfg: Dict[st
                 "Ray-path Tx front filter requested but Tx forward direction is unavailable; exporting unfiltered paths."
             )
 
-    segments = []
-    num_vertices = verts.shape[0]
-    num_paths = verts.shape[3]
+    num_vertices = int(verts.shape[0])
+    num_paths = int(verts.shape[3])
+    # Each exported path contributes at most num_vertices + 1 segments.
+    segments = np.empty((max(min(max_paths, num_paths), 1) * (num_vertices + 1), 7), dtype=float)
+    num_segments = 0
     exported_paths = 0
     filtered_rear_paths = 0
-    for p in range(num_paths):
-        if not _path_is_valid(valid, p):
-            continue
+    keep_idx = _valid_path_indices(valid, num_paths)
+    if tx_forward is None:
+        # Without the rear filter every valid path is exported, so only the first max_paths are needed.
+        keep_idx = keep_idx[: max(max_paths, 1)]
+    # Gather vertex and interaction data for the kept paths in one shot.
+    if _num_elements(interactions):
+        valid_inter_all = _gather_first_link_paths(interactions, keep_idx) != 0
+    elif _num_elements(objects):
+        valid_inter_all = _gather_first_link_paths(objects, keep_idx) != -1
+    else:
+        valid_inter_all = None
+    verts_all = _gather_first_link_paths(verts, keep_idx)
+    for k, p in enumerate(keep_idx.tolist()):
         pts = [src]
-        if interactions.size:
-            inter = interactions[:, 0, 0, p]
-            valid_inter = inter != 0
-        elif objects.size:
-            inter = objects[:, 0, 0, p]
-            valid_inter = inter != -1
-        else:
-            valid_inter = None
-        v = verts[:, 0, 0, p, :]
-        for i in range(num_vertices):
-            if valid_inter is not None and valid_inter[i]:
-                pts.append(v[i])
+        if valid_inter_all is not None:
+            pts.extend(verts_all[valid_inter_all[:, k], k, :])
         pts.append(tgt)
         if len(pts) < 2:
             continue
@@ -185,14 +234,18 @@ def _extract_ray_path_segments(paths: Any, cfg: Dict[str, Any], vis_cfg: Dict[st
             if launch_dir is None or float(np.dot(launch_dir, tx_forward)) <= 0.0:
                 filtered_rear_paths += 1
                 continue
-        for i in range(len(pts) - 1):
-            segments.append([p, *pts[i], *pts[i + 1]])
+        num_new = len(pts) - 1
+        block = segments[num_segments : num_segments + num_new]
+        block[:, 0] = p
+        block[:, 1:4] = pts[:-1]
+        block[:, 4:7] = pts[1:]
+        num_segments += num_new
         exported_paths += 1
         if exported_paths >= max_paths:
             break
 
     return {
-        "segments": np.asarray(segments, dtype=float) if segments else np.zeros((0, 7), dtype=float),
+        "segments": segments[:num_segments],
         "exported_paths": exported_paths,
         "filtered_rear_paths": filtered_rear_paths,
         "tx_position": src,
@@ -200,6 +253,77 @@ def _extract_ray_path_segments(paths: Any, cfg: Dict[str, Any], vis_cfg: Dict[st
     }
 
 
+_PATHS_CSV_HEADER = (
+    "path_id",
+    "order",
+    "type",
+    "path_length_m",
+    "delay_s",
+    "power_linear",
+    "power_db",
+    "interactions",
+)
+
+
+def _write_paths_csv(path: Path, rows: list[Dict[str, Any]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(_PATHS_CSV_HEADER)
+        writer.writerows(
+            (
+                row["path_id"],
+                row["order"],
+                row["type"],
+                f"{row['path_length_m']:.6f}",
+                f"{row['delay_s']:.9e}",
+                f"{row['power_linear']:.6e}",
+                f"{row['power_db']:.3f}",
+                ";".join(row["interactions"]),
+            )
+            for row in rows
+        )
+
+
+def _export_paths_table(paths: Any, tx_power_dbm: float, path: Path) -> None:
+    path_table = build_paths_table(paths, tx_power_dbm=tx_power_dbm)
+    if path_table["rows"]:
+        _write_paths_csv(path, path_table["rows"])
+
+
+def _min_mean_max(values: np.ndarray) -> tuple[float, float, float]:
+    flat = np.asarray(values).reshape(-1)
+    return float(flat.min()), float(flat.mean()), float(flat.max())
+
+
+def _derive_radio_map_metrics(
+    path_gain: np.ndarray, tx_power_dbm: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, float]]:
+    """Derive dB maps from linear path gain with a single reduction pass.
+
+    Rx power and path loss are affine in path gain [dB], so their min/mean/max
+    follow from the path-gain reductions instead of three more array scans.
+    """
+    # In-place ufuncs keep one grid-sized temporary instead of three.
+    path_gain_db = np.add(path_gain, 1e-12)
+    np.log10(path_gain_db, out=path_gain_db)
+    path_gain_db *= 10.0
+    rx_power_dbm = np.add(path_gain_db, tx_power_dbm)
+    path_loss_db = np.negative(path_gain_db)
+    db_min, db_mean, db_max = _min_mean_max(path_gain_db)
+    stats = {
+        "path_gain_db_min": db_min,
+        "path_gain_db_mean": db_mean,
+        "path_gain_db_max": db_max,
+        "rx_power_dbm_min": tx_power_dbm + db_min,
+        "rx_power_dbm_mean": tx_power_dbm + db_mean,
+        "rx_power_dbm_max": tx_power_dbm + db_max,
+        "path_loss_db_min": -db_max,
+        "path_loss_db_mean": -db_mean,
+        "path_loss_db_max": -db_min,
+    }
+    return path_gain_db, rx_power_dbm, path_loss_db, stats
+
+
 def _radio_map_guide_paths(radio_map_cfg: Dict[str, Any]) -> list[Dict[str, Any]]:
     guide_paths = radio_map_cfg.get("guide_paths")
     if guide_paths is None:
@@ -393,6 +517,28 @@ def _radio_map_z_slice_specs(radio_map_cfg: Optional[Dict[str, Any]]) -> list[Di
     return specs
 
 
+def _radio_map_variant_specs(radio_map_cfg: Optional[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Extra radio maps computed on the already-built scene, one per ``radio_map.variants`` entry."""
+    variants = (radio_map_cfg or {}).get("variants") or []
+    if not isinstance(variants, list):
+        logger.warning("radio_map.variants must be a list of mappings; ignoring.")
+        return []
+    specs = []
+    seen: set[str] = set()
+    for idx, entry in enumerate(variants):
+        if not isinstance(entry, dict):
+            logger.warning("Ignoring radio_map.variants[%d]: expected a mapping.", idx)
+            continue
+        overrides = dict(entry)
+        name = str(overrides.pop("name", "") or f"{idx}")
+        token = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or f"{idx}"
+        if token in seen:
+            token = f"{token}_{idx}"
+        seen.add(token)
+        specs.append({"name": name, "suffix": f"variant_{token}", "overrides": overrides})
+    return specs
+
+
 def _format_radio_map_plane_z_token(z_m: float) -> str:
     if z_m < 0.0:
         return f"zm{abs(float(z_m)):.2f}".replace(".", "p")
@@ -543,8 +689,8 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
         cfg.output.get("base_dir", "outputs"),
         run_id=cfg.output.get("run_id"),
     )
+    config_hash = compute_config_hash(cfg.data)
     save_yaml(output_dir / "config.yaml", cfg.data)
-    config_hash = hashlib.sha256(json.dumps(cfg.data, sort_keys=True).encode("utf-8")).hexdigest()
     log_path = output_dir / "run.log"
     log_stream = log_path.open("a", encoding="utf-8")
     file_handler = logging.FileHandler(log_path, encoding="utf-8")
@@ -570,6 +716,9 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
         os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
     prefer_gpu = bool(runtime_cfg.get("prefer_gpu", True)) and not runtime_cfg.get("force_cpu")
+    if runtime_cfg.get("parallel_init", False):
+        # Overlap the TensorFlow import with Mitsuba variant selection.
+        start_tensorflow_import(mode=str(runtime_cfg.get("tensorflow_import", "auto")))
     variant = select_mitsuba_variant(
         prefer_gpu=prefer_gpu,
         forced_variant=str(runtime_cfg.get("mitsuba_variant", "auto")),
@@ -583,7 +732,8 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
         disable_pythreejs_import("simulate")
     tf_device_info = configure_tensorflow_for_mitsuba_variant(variant)
     tf_info = configure_tensorflow_memory_growth(
-        mode=str(runtime_cfg.get("tensorflow_import", "auto"))
+        mode=str(runtime_cfg.get("tensorflow_import", "auto")),
+        memory_limit_mb=runtime_cfg.get("tensorflow_memory_limit_mb"),
     )
     if tf_device_info:
         tf_info.setdefault("device_policy", tf_device_info)
@@ -625,6 +775,21 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
 
     plots_dir = output_dir / "plots"
     data_dir = output_dir / "data"
+    npz_compression = str(cfg.output.get("npz_compression", "none")).strip().lower()
+    if npz_compression not in NPZ_COMPRESSION_MODES:
+        logger.warning("Unsupported output.npz_compression %r; writing uncompressed .npz.", npz_compression)
+        npz_compression = "none"
+    db_dtype_name = str(cfg.output.get("db_dtype", "float32")).strip().lower()
+    if db_dtype_name not in {"float32", "float16"}:
+        logger.warning("Unsupported output.db_dtype %r; storing dB maps as float32.", db_dtype_name)
+        db_dtype_name = "float32"
+    db_dtype = np.dtype(db_dtype_name)
+    radio_map_layout = str(cfg.output.get("radio_map_layout", "npz")).strip().lower()
+    if radio_map_layout not in {"npz", "npy", "both"}:
+        logger.warning("Unsupported output.radio_map_layout %r; writing radio_map .npz files.", radio_map_layout)
+        radio_map_layout = "npz"
+    # radio_map.npz is the canonical grid output; runs that only need the npz can skip the CSV copy.
+    export_radio_map_csv = bool(cfg.output.get("export_csv", True))
     plots_dir.mkdir(parents=True, exist_ok=True)
     data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -639,19 +804,19 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
             "progress": min(step_index / total, 1.0) if total else 1.0,
             "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
         }
-        save_json(progress_path, payload)
+        save_json_atomic(progress_path, payload)
 
-    run_start = time.time()
+    run_start = time.perf_counter()
     try:
         with contextlib.redirect_stdout(log_stream), contextlib.redirect_stderr(log_stream):
             try:
                 with progress_steps("Simulation", len(steps)) as (progress, task_id):
                     step_idx = 0
                     write_progress(step_idx, "running")
-                    t0 = time.time()
+                    t0 = time.perf_counter()
                     progress.update(task_id, description=steps[0])
                     scene = build_scene(cfg.data, mitsuba_variant=variant)
-                    timings["scene_build_s"] = time.time() - t0
+                    timings["scene_build_s"] = time.perf_counter() - t0
                     scene_cfg = cfg.scene
                     if scene_cfg.get("type") == "file":
                         _apply_default_radio_materials(scene)
@@ -687,17 +852,20 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                     render_cfg = cfg.data.get("render", {})
                     if render_cfg.get("enabled", True):
                         try:
-                            from sionna.rt import Camera
-
+                            Camera = _sionna_camera_cls()
                             cam_cfg = cfg.scene.get("camera", {})
                             cam = Camera(
                                 name=cam_cfg.get("name", "camera"),
                                 position=np.array(cam_cfg.get("position", [0.0, 80.0, 500.0])),
                                 orientation=np.array(cam_cfg.get("orientation", [0.0, 1.5708, -1.5708])),
                             )
+                            render_format = str(render_cfg.get("format", "png")).strip().lower().lstrip(".")
+                            if render_format not in _RENDER_FORMATS:
+                                logger.warning("Unsupported render.format %r; using png.", render_format)
+                                render_format = "png"
                             scene.render_to_file(
                                 camera=cam,
-                                filename=str(output_dir / "plots" / "scene.png"),
+                                filename=str(output_dir / "plots" / f"scene.{render_format}"),
                                 num_samples=int(render_cfg.get("samples", 64)),
                                 resolution=tuple(render_cfg.get("resolution", [800, 600])),
                             )
@@ -728,19 +896,21 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                     tx_device = next(iter(scene.transmitters.values()))
                     rx_device = next(iter(scene.receivers.values()), None)
                     tx_pos = _to_numpy(tx_device.position).reshape(-1)
+                    # One device->host sync for the Tx power; reused by every metric and radio map below.
+                    tx_power_dbm = float(_to_numpy(tx_device.power_dbm).item())
                     rx_pos = _to_numpy(rx_device.position).reshape(-1) if rx_device is not None else None
                     if compute_paths_enabled:
-                        t0 = time.time()
+                        t0 = time.perf_counter()
                         progress.update(task_id, description="Ray trace paths")
                         write_progress(step_idx, "running")
                         if ris_runtime:
                             logger.info("RIS enabled in scene (%d objects). compute_paths.ris=%s", len(ris_runtime), use_ris_paths)
                         paths = _compute_paths_with_current_flags(scene, sim_cfg, use_ris=use_ris_paths)
-                        timings["path_tracing_s"] = time.time() - t0
+                        timings["path_tracing_s"] = time.perf_counter() - t0
                         progress.advance(task_id)
                         step_idx += 1
 
-                        metrics = compute_path_metrics(paths, tx_power_dbm=tx_device.power_dbm, scene=scene)
+                        metrics = compute_path_metrics(paths, tx_power_dbm=tx_power_dbm, scene=scene)
                         if metrics.get("num_ris_paths") is not None:
                             logger.info("RIS paths detected: %s", metrics["num_ris_paths"])
                             if ris_runtime and metrics.get("num_ris_paths") == 0:
@@ -750,7 +920,7 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                                 )
                         path_data = extract_path_data(paths)
                         metrics.update(path_data.get("metrics", {}))
-                        probe_t0 = time.time()
+                        probe_t0 = time.perf_counter()
                         ris_link_probe = _compute_ris_link_probe(
                             scene,
                             sim_cfg,
@@ -760,43 +930,13 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                             use_ris_paths=use_ris_paths,
                         )
                         if ris_link_probe is not None:
-                            timings["ris_link_probe_s"] = time.time() - probe_t0
+                            timings["ris_link_probe_s"] = time.perf_counter() - probe_t0
                         if ris_link_probe is not None:
                             metrics["ris_link_probe"] = ris_link_probe
                             delta_gain = ris_link_probe.get("delta_total_path_gain_db")
                             if delta_gain is not None:
                                 logger.info("RIS link probe: on-off total path gain delta = %.2f dB", float(delta_gain))
-                        path_table = build_paths_table(paths, tx_power_dbm=tx_device.power_dbm)
-                        if path_table["rows"]:
-                            import csv
-
-                            with (output_dir / "data" / "paths.csv").open("w", encoding="utf-8", newline="") as f:
-                                writer = csv.writer(f)
-                                writer.writerow(
-                                    [
-                                        "path_id",
-                                        "order",
-                                        "type",
-                                        "path_length_m",
-                                        "delay_s",
-                                        "power_linear",
-                                        "power_db",
-                                        "interactions",
-                                    ]
-                                )
-                                for row in path_table["rows"]:
-                                    writer.writerow(
-                                        [
-                                            row["path_id"],
-                                            row["order"],
-                                            row["type"],
-                                            f"{row['path_length_m']:.6f}",
-                                            f"{row['delay_s']:.9e}",
-                                            f"{row['power_linear']:.6e}",
-                                        f"{row['power_db']:.3f}",
-                                        ";".join(row["interactions"]),
-                                    ]
-                                )
+                        _export_paths_table(paths, tx_power_dbm, output_dir / "data" / "paths.csv")
 
                     radio_map_cfg = dict(cfg.radio_map)
                     if ris_isolation:
@@ -1001,7 +1141,7 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                         axis_labels: tuple[str, str] = ("x [m]", "y [m]"),
                     ) -> tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
                         nonlocal radio_map
-                        t0 = time.time()
+                        t0 = time.perf_counter()
                         progress.update(task_id, description=f"Radio map ({label})")
                         write_progress(step_idx, "running")
                         # Allow a Z-only override that doesn't affect X/Y center.
@@ -1043,37 +1183,36 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                             if profile_snapshots is not None:
                                 _restore_ris_profiles(scene, profile_snapshots)
                         timings_key = f"radio_map_{label}_s" if label else "radio_map_s"
-                        timings[timings_key] = time.time() - t0
+                        timings[timings_key] = time.perf_counter() - t0
                         radio_map = result
 
-                        path_gain = _to_numpy(result.path_gain)
+                        # Slice the first transmitter before the host copy so only one grid crosses over.
+                        path_gain = result.path_gain
+                        path_gain_tx = _to_numpy(path_gain[0] if len(path_gain.shape) == 3 else path_gain)
                         cell_centers = _to_numpy(result.cell_centers)
-                        path_gain_tx = path_gain[0] if path_gain.ndim == 3 else path_gain
-                        path_gain_db = 10.0 * np.log10(path_gain_tx + 1e-12)
-                        tx_power_dbm = _to_numpy(tx_device.power_dbm).item()
-                        rx_power_dbm = tx_power_dbm + path_gain_db
-                        path_loss_db = -path_gain_db
-
-                        npz_name = "radio_map.npz" if write_default else f"radio_map_{suffix}.npz"
-                        np.savez_compressed(
-                            data_dir / npz_name,
+                        path_gain_db, rx_power_dbm, path_loss_db, stats = _derive_radio_map_metrics(
+                            path_gain_tx, tx_power_dbm
+                        )
+
+                        radio_map_stem = "radio_map" if write_default else f"radio_map_{suffix}"
+                        radio_map_arrays = dict(
                             path_gain_linear=path_gain_tx,
-                            path_gain_db=path_gain_db,
-                            rx_power_dbm=rx_power_dbm,
-                            path_loss_db=path_loss_db,
+                            path_gain_db=path_gain_db.astype(db_dtype, copy=False),
+                            rx_power_dbm=rx_power_dbm.astype(db_dtype, copy=False),
+                            path_loss_db=path_loss_db.astype(db_dtype, copy=False),
                             cell_centers=cell_centers,
                         )
+                        if radio_map_layout in {"npz", "both"}:
+                            save_npz(data_dir / f"{radio_map_stem}.npz", npz_compression, **radio_map_arrays)
+                        if radio_map_layout in {"npy", "both"}:
+                            save_npy_dir(data_dir / radio_map_stem, **radio_map_arrays)
 
-                        if write_default:
-                            flat_gain = path_gain_db.reshape(-1)
-                            flat_centers = cell_centers.reshape(-1, 3)
-                            csv_data = np.column_stack([flat_centers, flat_gain])
-                            np.savetxt(
+                        if write_default and export_radio_map_csv:
+                            save_csv(
                                 data_dir / "radio_map.csv",
-                                csv_data,
-                                delimiter=",",
+                                [cell_centers.reshape(-1, 3), path_gain_db.reshape(-1)],
                                 header="x,y,z,path_gain_db",
-                                comments="",
+                                fmt=["%.9g"] * 4,
                             )
 
                         plot_style = str(cfg_base.get("plot_style", "heatmap")).lower()
@@ -1107,6 +1246,24 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                                     show_ris=show_ris,
                                     title_suffix=title_suffix,
                                 )
+                        elif plot_style == "raster":
+                            for metric_map, metric_name in (
+                                (path_gain_db, "path_gain_db"),
+                                (rx_power_dbm, "rx_power_dbm"),
+                                (path_loss_db, "path_loss_db"),
+                            ):
+                                plot_radio_map_raster(
+                                    metric_map,
+                                    plots_dir,
+                                    filename_prefix=_radio_map_plot_filename_prefix(
+                                        write_default=write_default,
+                                        suffix=suffix,
+                                        metric_name=metric_name,
+                                        kwargs=kwargs,
+                                    ),
+                                    vmin=cfg_base.get("plot_vmin"),
+                                    vmax=cfg_base.get("plot_vmax"),
+                                )
                         else:
                             ris_positions = []
                             try:
@@ -1114,73 +1271,35 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                             except Exception:
                                 ris_positions = []
                             guide_paths = _radio_map_guide_paths(cfg_base)
-                            plot_radio_map(
-                                path_gain_db,
-                                cell_centers,
-                                plots_dir,
-                                metric_label="Path gain [dB]",
-                                filename_prefix=_radio_map_plot_filename_prefix(
-                                    write_default=write_default,
-                                    suffix=suffix,
-                                    metric_name="path_gain_db",
-                                    kwargs=kwargs,
-                                ),
-                                tx_pos=tx_pos,
-                                rx_pos=rx_pos,
-                                ris_positions=ris_positions,
-                                guide_paths=guide_paths,
-                                axis_labels=axis_labels,
-                                title_suffix=title_suffix,
-                            )
-                            plot_radio_map(
-                                rx_power_dbm,
-                                cell_centers,
-                                plots_dir,
-                                metric_label="Rx power [dBm]",
-                                filename_prefix=_radio_map_plot_filename_prefix(
-                                    write_default=write_default,
-                                    suffix=suffix,
-                                    metric_name="rx_power_dbm",
-                                    kwargs=kwargs,
-                                ),
-                                tx_pos=tx_pos,
-                                rx_pos=rx_pos,
-                                ris_positions=ris_positions,
-                                guide_paths=guide_paths,
-                                axis_labels=axis_labels,
-                                title_suffix=title_suffix,
-                            )
-                            plot_radio_map(
-                                path_loss_db,
-                                cell_centers,
-                                plots_dir,
-                                metric_label="Path loss [dB]",
-                                filename_prefix=_radio_map_plot_filename_prefix(
-                                    write_default=write_default,
-                                    suffix=suffix,
-                                    metric_name="path_loss_db",
-                                    kwargs=kwargs,
-                                ),
-                                tx_pos=tx_pos,
-                                rx_pos=rx_pos,
-                                ris_positions=ris_positions,
-                                guide_paths=guide_paths,
-                                axis_labels=axis_labels,
-                                title_suffix=title_suffix,
-                            )
+                            plot_jobs = []
+                            for metric_map, metric_label, metric_name in (
+                                (path_gain_db, "Path gain [dB]", "path_gain_db"),
+                                (rx_power_dbm, "Rx power [dBm]", "rx_power_dbm"),
+                                (path_loss_db, "Path loss [dB]", "path_loss_db"),
+                            ):
+                                plot_jobs.append(
+                                    dict(
+                                        metric_map=metric_map,
+                                        cell_centers=cell_centers,
+                                        output_dir=plots_dir,
+                                        metric_label=metric_label,
+                                        filename_prefix=_radio_map_plot_filename_prefix(
+                                            write_default=write_default,
+                                            suffix=suffix,
+                                            metric_name=metric_name,
+                                            kwargs=kwargs,
+                                        ),
+                                        tx_pos=tx_pos,
+                                        rx_pos=rx_pos,
+                                        ris_positions=ris_positions,
+                                        guide_paths=guide_paths,
+                                        axis_labels=axis_labels,
+                                        title_suffix=title_suffix,
+                                    )
+                                )
+                            plot_radio_map_batch(plot_jobs, max_workers=int(cfg_base.get("plot_workers", 1)))
 
-                        stats = {
-                            "path_gain_db_min": float(np.min(path_gain_db)),
-                            "path_gain_db_mean": float(np.mean(path_gain_db)),
-                            "path_gain_db_max": float(np.max(path_gain_db)),
-                            "rx_power_dbm_min": float(np.min(rx_power_dbm)),
-                            "rx_power_dbm_mean": float(np.mean(rx_power_dbm)),
-                            "rx_power_dbm_max": float(np.max(rx_power_dbm)),
-                            "path_loss_db_min": float(np.min(path_loss_db)),
-                            "path_loss_db_mean": float(np.mean(path_loss_db)),
-                            "path_loss_db_max": float(np.max(path_loss_db)),
-                            "grid_shape": list(path_gain_db.shape[-2:]),
-                        }
+                        stats["grid_shape"] = list(path_gain_db.shape[-2:])
                         summary = {
                             "label": label,
                             "suffix": suffix,
@@ -1294,6 +1413,16 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                                     )
                                     radio_map_summaries.append(summary_incidence)
 
+                        for variant_spec in _radio_map_variant_specs(radio_map_cfg):
+                            summary_variant, _, _ = _compute_radio_map(
+                                label=variant_spec["suffix"],
+                                overrides=variant_spec["overrides"],
+                                suffix=variant_spec["suffix"],
+                                write_default=False,
+                            )
+                            summary_variant["display_label"] = variant_spec["name"]
+                            radio_map_summaries.append(summary_variant)
+
                         if has_ris and bool(radio_map_cfg.get("ris_off_map", False)):
                             summary_ris_off, _, _ = _compute_radio_map(
                                 label="ris_off",
@@ -1357,11 +1486,14 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                                 logger.warning("Radio map diff skipped: grid mismatch between RIS and baseline.")
                             else:
                                 diff_db = ris_data["path_gain_db"] - base_data["path_gain_db"]
-                                np.savez_compressed(
-                                    data_dir / "radio_map_diff.npz",
-                                    path_gain_db=diff_db,
+                                diff_arrays = dict(
+                                    path_gain_db=diff_db.astype(db_dtype, copy=False),
                                     cell_centers=ris_centers,
                                 )
+                                if radio_map_layout in {"npz", "both"}:
+                                    save_npz(data_dir / "radio_map_diff.npz", npz_compression, **diff_arrays)
+                                if radio_map_layout in {"npy", "both"}:
+                                    save_npy_dir(data_dir / "radio_map_diff", **diff_arrays)
                                 plot_radio_map(
                                     diff_db,
                                     ris_centers,
@@ -1373,10 +1505,11 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                                     ris_positions=[np.asarray(r.position).reshape(-1) for r in scene.ris.values()] if hasattr(scene, "ris") else [],
                                     guide_paths=_radio_map_guide_paths(radio_map_cfg),
                                 )
+                                diff_min, diff_mean, diff_max = _min_mean_max(diff_db)
                                 metrics["radio_map_diff"] = {
-                                    "path_gain_db_min": float(np.min(diff_db)),
-                                    "path_gain_db_mean": float(np.mean(diff_db)),
-                                    "path_gain_db_max": float(np.max(diff_db)),
+                                    "path_gain_db_min": diff_min,
+                                    "path_gain_db_mean": diff_mean,
+                                    "path_gain_db_max": diff_max,
                                 }
                         except Exception as exc:
                             logger.warning("Radio map diff failed: %s", exc)
@@ -1387,7 +1520,7 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                         progress.update(task_id, description="Plots")
                     else:
                         progress.update(task_id, description="Plots (skipped)")
-                    plot_t0 = time.time()
+                    plot_t0 = time.perf_counter()
                     if path_data["delays_s"].size > 0:
                         plot_histogram(
                             path_data["delays_s"],
@@ -1417,7 +1550,7 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                         metrics["radio_map"] = radio_map_summaries
                     if radio_map_visibility is not None:
                         metrics["radio_map_visibility"] = radio_map_visibility
-                    timings["plots_s"] = time.time() - plot_t0
+                    timings["plots_s"] = time.perf_counter() - plot_t0
                     progress.advance(task_id)
                     write_progress(len(steps), "completed")
 
@@ -1428,14 +1561,17 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                         export = _extract_ray_path_segments(paths, cfg.data, vis_cfg)
                         segments_arr = export["segments"]
                         if segments_arr.size:
-                            np.savetxt(
+                            save_csv(
                                 data_dir / "ray_paths.csv",
                                 segments_arr,
-                                delimiter=",",
                                 header="path_id,x0,y0,z0,x1,y1,z1",
-                                comments="",
+                                fmt=["%d"] + ["%.9g"] * 6,
                             )
-                            np.savez_compressed(data_dir / "ray_paths.npz", segments=segments_arr)
+                            # Same layout switch as the radio map: the viewer memory-maps the .npy form.
+                            if radio_map_layout in {"npz", "both"}:
+                                save_npz(data_dir / "ray_paths.npz", npz_compression, segments=segments_arr)
+                            if radio_map_layout in {"npy", "both"}:
+                                np.save(data_dir / "ray_paths.npy", np.asarray(segments_arr, dtype=np.float64))
                             plot_rays_3d(
                                 segments_arr,
                                 tx_pos=export["tx_position"],
@@ -1449,7 +1585,7 @@ def run_simulation(config_path: str, overrides: Optional[Dict[str, Any]] = None)
                     except Exception as exc:  # pragma: no cover
                         logger.warning("Ray path export failed: %s", exc)
 
-                timings["total_s"] = time.time() - run_start
+                timings["total_s"] = time.perf_counter() - run_start
                 summary = {
                     "metrics": metrics,
                     "scene_sanity": scene_sanity_report(scene, cfg.data),
@@ -1,11 +1,40 @@
+import os
+import sys
 from contextlib import contextmanager
+from typing import Optional
 
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
 
 
+class _NullProgress:
+    """Stand-in for rich Progress when nobody is watching the terminal."""
+
+    def update(self, task_id, **kwargs) -> None:
+        pass
+
+    def advance(self, task_id, advance: float = 1) -> None:
+        pass
+
+
+def _is_interactive() -> bool:
+    if os.environ.get("CI"):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
 @contextmanager
-def progress_steps(label: str, total_steps: int):
-    """Simple stage-based progress with clear step labels."""
+def progress_steps(label: str, total_steps: int, interactive: Optional[bool] = None):
+    """Simple stage-based progress with clear step labels.
+
+    Non-interactive output (no TTY, or ``CI`` set) gets a no-op progress so no
+    live-refresh thread runs and logs stay free of redraw noise.
+    """
+    if interactive is None:
+        interactive = _is_interactive()
+    if not interactive:
+        yield _NullProgress(), 0
+        return
     columns = [
         SpinnerColumn(),
         TextColumn("{task.description}"),
@@ -1,7 +1,13 @@
+import array
+import copy
 import ctypes
+import functools
+import importlib
 import importlib.metadata
+import importlib.util
 import logging
 import json
+import math
 import os
 import platform
 import re
@@ -9,7 +15,8 @@ import subprocess
 import sys
 import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+import types
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 
 _DRJIT_CACHE_DIR = os.environ.get("DRJIT_CACHE_DIR", "/tmp/drjit-cache")
@@ -19,10 +26,43 @@ try:
 except Exception:
     pass
 
+_IS_DARWIN = platform.system() == "Darwin"
+
 _REPO_SIONNA_BASELINE = "0.19.2"
 _REPO_NUMPY_BASELINE = "1.26.4"
 
+def _normalize_dist_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# Packages reported in collect_environment_info()["versions"].
+_ENV_PACKAGES = ("sionna", "sionna-rt", "tensorflow", "drjit", "mitsuba", "numpy")
+_ENV_PACKAGE_KEYS = frozenset(_normalize_dist_name(pkg) for pkg in _ENV_PACKAGES)
+
+
+@functools.lru_cache(maxsize=1)
+def _version_map() -> Dict[str, str]:
+    """Versions of the _ENV_PACKAGES distributions from one metadata scan.
+
+    Names come from the dist-info directory where possible, so METADATA is
+    only parsed for the handful of distributions that are actually wanted.
+    """
+    versions: Dict[str, str] = {}
+    for dist in importlib.metadata.distributions():
+        name = getattr(dist, "_normalized_name", None) or dist.metadata["Name"]
+        if not name:
+            continue
+        key = _normalize_dist_name(name)
+        if key in _ENV_PACKAGE_KEYS and key not in versions:
+            versions[key] = dist.version
+    return versions
+
+
+@functools.lru_cache(maxsize=None)
 def _safe_version(pkg: str) -> Optional[str]:
+    key = _normalize_dist_name(pkg)
+    if key in _ENV_PACKAGE_KEYS:
+        return _version_map().get(key)
     try:
         return importlib.metadata.version(pkg)
     except importlib.metadata.PackageNotFoundError:
@@ -48,62 +88,112 @@ def _repo_runtime_warnings(
     return warnings
 
 
-def _preferred_cuda_variant(variants: list[str]) -> Optional[str]:
-    for candidate in [
-        "cuda_ad_mono_polarized",
-        "cuda_ad_spectral_polarized",
-        "cuda_ad_mono",
-        "cuda_ad_spectral",
-        "cuda_ad_rgb",
-    ]:
-        if candidate in variants:
-            return candidate
-    return None
+_CUDA_VARIANT_PREFERENCE = (
+    "cuda_ad_mono_polarized",
+    "cuda_ad_spectral_polarized",
+    "cuda_ad_mono",
+    "cuda_ad_spectral",
+    "cuda_ad_rgb",
+)
+# Prefer spectral variants on CPU to avoid RGB spectrum shape mismatches.
+_CPU_VARIANT_PREFERENCE = (
+    "llvm_ad_mono_polarized",
+    "llvm_ad_spectral_polarized",
+    "llvm_ad_spectral",
+    "llvm_ad_rgb",
+    "scalar_spectral_polarized",
+    "scalar_spectral",
+    "scalar_rgb",
+)
 
 
-def disable_pythreejs_import(reason: str = "cli") -> None:
-    """Stub out pythreejs to avoid slow imports when previews are unused."""
-    import sys
-    import types
+@functools.lru_cache(maxsize=8)
+def _preferred_cuda_variant(variants: FrozenSet[str]) -> Optional[str]:
+    return next((v for v in _CUDA_VARIANT_PREFERENCE if v in variants), None)
 
-    if "pythreejs" in sys.modules:
+
+@functools.lru_cache(maxsize=8)
+def _preferred_cpu_variant(variants: FrozenSet[str]) -> Optional[str]:
+    return next((v for v in _CPU_VARIANT_PREFERENCE if v in variants), None)
+
+
+@functools.lru_cache(maxsize=1)
+def _mitsuba_variants() -> Tuple[str, ...]:
+    """Variants compiled into the installed Mitsuba; fixed for the process."""
+    import mitsuba as mi
+
+    return tuple(mi.variants())
+
+
+@functools.lru_cache(maxsize=1)
+def _mitsuba_variant_set() -> FrozenSet[str]:
+    return frozenset(_mitsuba_variants())
+
+
+def _drjit_thread_count() -> Optional[int]:
+    override = os.environ.get("RIS_SIONNA_DRJIT_THREADS")
+    if override:
+        try:
+            count = int(override)
+        except ValueError:
+            count = 0
+        if count > 0:
+            return count
+        logging.getLogger(__name__).warning("Ignoring invalid RIS_SIONNA_DRJIT_THREADS=%r", override)
+    try:
+        # Honors cgroup/taskset CPU restrictions, unlike os.cpu_count().
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS
+        return None
+
+
+def _pin_drjit_threads(variant: str) -> None:
+    if "llvm" not in variant:
+        return
+    count = _drjit_thread_count()
+    if not count:
         return
+    try:
+        import drjit as dr
+
+        dr.set_thread_count(count)
+    except Exception:  # pragma: no cover - depends on Dr.Jit build
+        pass
+
+
+class _PythreejsDummy:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return None
+
+
+def _pythreejs_stub_getattr(name: str):
+    return _PythreejsDummy
+
+
+_PYTHREEJS_STUB: Optional[types.ModuleType] = None
+
+
+def _build_pythreejs_stub(reason: str) -> types.ModuleType:
     stub = types.ModuleType("pythreejs")
     stub.__dict__["__ris_sionna_stub__"] = reason
+    stub.__getattr__ = _pythreejs_stub_getattr  # type: ignore[attr-defined]
+    return stub
 
-    class _Dummy:
-        def __init__(self, *args, **kwargs):
-            pass
 
-        def __call__(self, *args, **kwargs):
-            return None
-
-    for name in [
-        "PerspectiveCamera",
-        "OrthographicCamera",
-        "Mesh",
-        "BufferGeometry",
-        "MeshLambertMaterial",
-        "MeshBasicMaterial",
-        "LineBasicMaterial",
-        "LineSegments",
-        "Scene",
-        "DirectionalLight",
-        "AmbientLight",
-        "Vector3",
-        "SpriteMaterial",
-        "Sprite",
-        "Group",
-        "AxesHelper",
-        "GridHelper",
-    ]:
-        stub.__dict__[name] = _Dummy
-
-    def __getattr__(name: str):
-        return _Dummy
-
-    stub.__getattr__ = __getattr__  # type: ignore[attr-defined]
-    sys.modules["pythreejs"] = stub
+def disable_pythreejs_import(reason: str = "cli") -> None:
+    """Stub out pythreejs to avoid slow imports when previews are unused.
+
+    The stub module is built once per process and reused on later calls.
+    """
+    global _PYTHREEJS_STUB
+    if "pythreejs" in sys.modules:
+        return
+    if _PYTHREEJS_STUB is None:
+        _PYTHREEJS_STUB = _build_pythreejs_stub(reason)
+    sys.modules.setdefault("pythreejs", _PYTHREEJS_STUB)
 
 
 def select_mitsuba_variant(
@@ -119,16 +209,17 @@ def select_mitsuba_variant(
         pass
     import mitsuba as mi
 
-    variants = list(mi.variants())
+    variants = list(_mitsuba_variants())
     logger = logging.getLogger(__name__)
     if forced_variant and forced_variant != "auto":
-        if forced_variant not in variants:
+        if forced_variant not in _mitsuba_variant_set():
             raise ValueError(f"Requested Mitsuba variant '{forced_variant}' not in {variants}")
+        _pin_drjit_threads(forced_variant)
         mi.set_variant(forced_variant)
         return mi.variant()
 
     if prefer_gpu:
-        candidate = _preferred_cuda_variant(variants)
+        candidate = _preferred_cuda_variant(_mitsuba_variant_set())
         if candidate:
             try:
                 mi.set_variant(candidate)
@@ -141,21 +232,9 @@ def select_mitsuba_variant(
                         "Ensure NVIDIA driver + CUDA runtime are compatible."
                     ) from exc
 
-    # Prefer spectral variants on CPU to avoid RGB spectrum shape mismatches.
-    for candidate in [
-        "llvm_ad_mono_polarized",
-        "llvm_ad_spectral_polarized",
-        "llvm_ad_spectral",
-        "llvm_ad_rgb",
-        "scalar_spectral_polarized",
-        "scalar_spectral",
-        "scalar_rgb",
-    ]:
-        if candidate in variants:
-            mi.set_variant(candidate)
-            return mi.variant()
-
-    mi.set_variant(variants[0])
+    candidate = _preferred_cpu_variant(_mitsuba_variant_set()) or variants[0]
+    _pin_drjit_threads(candidate)
+    mi.set_variant(candidate)
     return mi.variant()
 
 
@@ -240,13 +319,41 @@ def configure_tensorflow_for_mitsuba_variant(variant: str | None) -> Dict[str, A
     return info
 
 
+def _loaded_module(name: str) -> Optional[Any]:
+    """Return ``sys.modules[name]`` only once its import has fully finished."""
+    module = sys.modules.get(name)
+    if module is None or getattr(getattr(module, "__spec__", None), "_initializing", False):
+        return None
+    return module
+
+
+def _module_installed(name: str) -> bool:
+    """Cheap presence check that never imports the package itself."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _start_daemon_thread(target: Callable[[], None], name: str) -> threading.Thread:
+    """Start ``target`` on a daemon thread; probes join it with a timeout and abandon it if it hangs."""
+    thread = threading.Thread(target=target, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
 def configure_tensorflow_memory_growth(
     timeout_s: float = 5.0,
     mode: str = "auto",
+    memory_limit_mb: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Attempt to configure TF GPU memory growth with a timeout to avoid hangs."""
-    import concurrent.futures
+    """Attempt to configure TF GPU memory growth with a timeout to avoid hangs.
 
+    With ``memory_limit_mb`` set, each GPU instead gets a fixed-size logical
+    device so TF reserves one arena up front rather than growing it per call.
+    """
     info: Dict[str, Any] = {}
     if mode not in {"auto", "force", "skip"}:
         info["tensorflow_import_error"] = f"Unknown tensorflow_import mode: {mode}"
@@ -254,27 +361,47 @@ def configure_tensorflow_memory_growth(
     if mode == "skip":
         info["tensorflow_import_skipped"] = True
         return info
-    if mode == "auto" and platform.system() == "Darwin":
+    if mode == "auto" and _IS_DARWIN:
         info["tensorflow_import_skipped"] = True
         info["tensorflow_import_reason"] = "darwin"
         return info
 
-    def _load_tf():
-        import tensorflow as tf  # pylint: disable=import-error
-        return tf
+    tf = _loaded_module("tensorflow")
+    if tf is None and not _module_installed("tensorflow"):
+        info["tensorflow_import_error"] = "TensorFlow not installed"
+        return info
+    if tf is None:
+        # A daemon thread lets a hung import be abandoned after timeout_s instead of joined.
+        result: Dict[str, Any] = {}
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_load_tf)
-        try:
-            tf = future.result(timeout=timeout_s)
-        except Exception as exc:  # pragma: no cover - optional runtime behavior
-            info["tensorflow_import_error"] = str(exc)
+        def _load_tf() -> None:
+            try:
+                import tensorflow as tf_module  # pylint: disable=import-error
+
+                result["tf"] = tf_module
+            except Exception as exc:  # pragma: no cover - optional dependency
+                result["error"] = exc
+
+        _start_daemon_thread(_load_tf, "tf-import").join(timeout_s)
+        if "tf" not in result:  # pragma: no cover - optional runtime behavior
+            info["tensorflow_import_error"] = str(result.get("error", f"import timed out after {timeout_s}s"))
             info["tensorflow_import_timeout_s"] = timeout_s
             return info
+        tf = result["tf"]
 
     gpus = tf.config.list_physical_devices("GPU")
     info["tf_gpus"] = [g.name for g in gpus]
-    if gpus:
+    if gpus and memory_limit_mb:
+        try:
+            for gpu in gpus:
+                tf.config.set_logical_device_configuration(
+                    gpu,
+                    [tf.config.LogicalDeviceConfiguration(memory_limit=int(memory_limit_mb))],
+                )
+            info["tf_memory_limit_mb"] = int(memory_limit_mb)
+        except RuntimeError as exc:
+            info["tf_memory_limit_error"] = str(exc)
+    elif gpus:
         try:
             for gpu in gpus:
                 tf.config.experimental.set_memory_growth(gpu, True)
@@ -284,52 +411,143 @@ def configure_tensorflow_memory_growth(
     return info
 
 
-def collect_environment_info() -> Dict[str, Any]:
-    info: Dict[str, Any] = {}
-    info["platform"] = platform.platform()
-    info["python_version"] = platform.python_version()
-    info["in_docker"] = os.path.exists("/.dockerenv")
-
-    info["versions"] = {
-        "sionna": _safe_version("sionna"),
-        "sionna-rt": _safe_version("sionna-rt"),
-        "tensorflow": _safe_version("tensorflow"),
-        "drjit": _safe_version("drjit"),
-        "mitsuba": _safe_version("mitsuba"),
-        "numpy": _safe_version("numpy"),
-    }
+def start_tensorflow_import(mode: str = "auto") -> Optional[Any]:
+    """Start importing TensorFlow in the background so it overlaps Mitsuba setup.
 
-    raw_smi = _nvidia_smi_output()
-    info["nvidia_smi"] = raw_smi
-    info["nvidia"] = _parse_nvidia_smi_versions(raw_smi)
-    info["optix"] = check_optix_runtime()
+    Only the module import is moved off the main thread; device configuration
+    still happens in ``configure_tensorflow_memory_growth`` once the Mitsuba
+    variant is known. Returns the pending future, or None when nothing started.
+    """
+    import concurrent.futures
 
+    if mode not in {"auto", "force"}:
+        return None
+    if mode == "auto" and _IS_DARWIN:
+        return None
+    if "tensorflow" in sys.modules or not _module_installed("tensorflow"):
+        return None
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tf-import")
     try:
-        import mitsuba as mi
-        info["mitsuba_variants"] = list(mi.variants())
+        return executor.submit(importlib.import_module, "tensorflow")
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+# Upper bounds for driver probes; a wedged driver can block NVML and nvidia-smi indefinitely.
+_NVML_TIMEOUT_S = 1.0
+_NVIDIA_SMI_TIMEOUT_S = 2.0
+
+
+@functools.lru_cache(maxsize=1)
+def _nvml_system_info() -> Optional[Dict[str, Any]]:
+    """Driver/CUDA versions and GPU names via NVML, or None without pynvml/NVML.
+
+    GPU topology does not change during a process, so the result is cached.
+    The query runs on a daemon thread and is abandoned after _NVML_TIMEOUT_S.
+    """
+    result: Dict[str, Any] = {}
+
+    def _query() -> None:
+        result["info"] = _query_nvml_system_info()
+
+    _start_daemon_thread(_query, "nvml-probe").join(_NVML_TIMEOUT_S)
+    return result.get("info")
+
+
+def _query_nvml_system_info() -> Optional[Dict[str, Any]]:
+    try:
+        import pynvml  # pylint: disable=import-error
+
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    try:
+        cuda = int(pynvml.nvmlSystemGetCudaDriverVersion())
+        handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+        return {
+            "driver_version": _decode(pynvml.nvmlSystemGetDriverVersion()),
+            "cuda_version": f"{cuda // 1000}.{(cuda % 1000) // 10}",
+            "gpus": [_decode(pynvml.nvmlDeviceGetName(h)) for h in handles],
+            "memory_total_mb": (
+                int(pynvml.nvmlDeviceGetMemoryInfo(handles[0]).total // (1024 * 1024)) if handles else None
+            ),
+        }
+    except Exception:
+        return None
+    finally:
         try:
-            info["mitsuba_variant"] = mi.variant()
-        except Exception as exc:  # pragma: no cover
-            info["mitsuba_variant_error"] = str(exc)
-    except Exception as exc:  # pragma: no cover
-        info["mitsuba_error"] = str(exc)
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
 
-    if platform.system() == "Darwin":
-        info["tensorflow_error"] = "Skipped TensorFlow import on macOS to avoid startup hangs."
+
+_PY_VERSION_STR = "%d.%d.%d" % sys.version_info[:3]
+# A process cannot move in or out of a container, so the marker file is checked once.
+_IN_DOCKER = os.path.exists("/.dockerenv")
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_string() -> str:
+    # platform.platform() reads /etc/os-release and libc info; it cannot change in-process.
+    return platform.platform()
+
+
+_ENV_INFO_CACHE: Optional[Dict[str, Any]] = None
+_ENV_INFO_LOCK = threading.Lock()
+
+
+def _collect_static_environment_info() -> Dict[str, Any]:
+    import concurrent.futures
+
+    # The subprocess, dlopen and metadata probes are independent; run them concurrently.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="env-probe") as executor:
+        variants_future = executor.submit(_mitsuba_variants) if _module_installed("mitsuba") else None
+        executor.submit(_version_map)
+        # nvidia-smi runs alongside NVML: its raw output is part of the reported schema.
+        smi_future = executor.submit(_nvidia_smi_probe)
+        nvml_info = _nvml_system_info()
+        memory_future = executor.submit(get_gpu_memory_mb)
+        optix_info = check_optix_runtime()
+
+    info: Dict[str, Any] = {}
+    info["platform"] = _platform_string()
+    info["python_version"] = _PY_VERSION_STR
+    info["in_docker"] = _IN_DOCKER
+
+    info["versions"] = {pkg: _safe_version(pkg) for pkg in _ENV_PACKAGES}
+
+    raw_smi, smi_error = smi_future.result()
+    info["nvidia_smi"] = raw_smi
+    if smi_error:
+        info["nvidia_smi_error"] = smi_error
+    if nvml_info is not None:
+        info["nvidia"] = {
+            "driver_version": nvml_info["driver_version"],
+            "cuda_version": nvml_info["cuda_version"],
+        }
+        info["nvidia_gpus"] = nvml_info["gpus"]
+    else:
+        info["nvidia"] = _parse_nvidia_smi_versions(raw_smi)
+    info["optix"] = optix_info
+
+    if variants_future is None:
+        info["mitsuba_error"] = "mitsuba not installed"
     else:
         try:
-            import tensorflow as tf
-            info["tensorflow_gpus"] = [g.name for g in tf.config.list_physical_devices("GPU")]
-            info["tensorflow_build"] = tf.sysconfig.get_build_info()
+            info["mitsuba_variants"] = list(variants_future.result())
         except Exception as exc:  # pragma: no cover
-            info["tensorflow_error"] = str(exc)
+            info["mitsuba_error"] = str(exc)
 
     info["docker_gpu_env"] = {
         "NVIDIA_VISIBLE_DEVICES": os.getenv("NVIDIA_VISIBLE_DEVICES"),
         "NVIDIA_DRIVER_CAPABILITIES": os.getenv("NVIDIA_DRIVER_CAPABILITIES"),
     }
 
-    info["gpu_memory_mb"] = get_gpu_memory_mb()
+    info["gpu_memory_mb"] = memory_future.result()
 
     warnings = _repo_runtime_warnings(
         python_info=(sys.version_info.major, sys.version_info.minor, sys.version_info.micro),
@@ -337,27 +555,83 @@ def collect_environment_info() -> Dict[str, Any]:
     )
     if warnings:
         info["warnings"] = warnings
+    return info
+
+
+def collect_tensorflow_build_info() -> Optional[Dict[str, Any]]:
+    """TensorFlow build metadata (CUDA/cuDNN versions), or None if TF is unavailable."""
+    try:
+        import tensorflow as tf
+        return dict(tf.sysconfig.get_build_info())
+    except Exception:
+        return None
+
+
+def collect_environment_info(
+    import_tensorflow: bool = False,
+    refresh: bool = False,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """Describe the host, driver and package stack.
+
+    Host/driver/package facts are collected once per process (``refresh=True``
+    re-probes them); the active Mitsuba variant and TensorFlow devices are read
+    on every call since they change during startup. TensorFlow details come
+    from the already-loaded module; a cold import only happens with
+    ``import_tensorflow=True`` (standalone env/diagnose commands), and the TF
+    build metadata is only added with ``verbose=True``.
+    """
+    global _ENV_INFO_CACHE
+    with _ENV_INFO_LOCK:
+        if refresh or _ENV_INFO_CACHE is None:
+            if refresh:
+                _nvml_system_info.cache_clear()
+                _nvidia_smi_banner.cache_clear()
+                get_gpu_memory_mb.cache_clear()
+            _ENV_INFO_CACHE = _collect_static_environment_info()
+        info = copy.deepcopy(_ENV_INFO_CACHE)
+
+    if "mitsuba_error" not in info:
+        try:
+            import mitsuba as mi
+            info["mitsuba_variant"] = mi.variant()
+        except Exception as exc:  # pragma: no cover
+            info["mitsuba_variant_error"] = str(exc)
+
+    if _IS_DARWIN:
+        info["tensorflow_error"] = "Skipped TensorFlow import on macOS to avoid startup hangs."
+    elif "tensorflow" not in sys.modules and not import_tensorflow:
+        info["tensorflow_error"] = "TensorFlow not loaded in this process; skipped import."
+    elif not _module_installed("tensorflow"):
+        info["tensorflow_error"] = "TensorFlow not installed"
+    else:
+        try:
+            import tensorflow as tf
+            info["tensorflow_gpus"] = [g.name for g in tf.config.list_physical_devices("GPU")]
+            if verbose:
+                info["tensorflow_build"] = tf.sysconfig.get_build_info()
+        except Exception as exc:  # pragma: no cover
+            info["tensorflow_error"] = str(exc)
 
     return info
 
 
 def print_environment_info() -> None:
-    info = collect_environment_info()
-    print(json.dumps(info, indent=2))
+    info = collect_environment_info(import_tensorflow=True, verbose=True)
+    json.dump(info, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
+@functools.lru_cache(maxsize=1)
 def get_gpu_memory_mb() -> Optional[int]:
-    """Return total GPU memory in MB for the first GPU, if available."""
-    try:
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=memory.total", "--format=csv,noheader,nounits"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        return None
-    output = result.stdout.strip()
+    """Return total GPU memory in MB for the first GPU, if available.
+
+    Total memory is fixed for the life of the process, so the query is cached.
+    """
+    nvml_info = _nvml_system_info()
+    if nvml_info is not None and nvml_info.get("memory_total_mb") is not None:
+        return nvml_info["memory_total_mb"]
+    output = _run_nvidia_smi_query("memory.total")
     if not output:
         return None
     first = output.splitlines()[0].strip()
@@ -374,8 +648,9 @@ def _run_nvidia_smi_query(fields: str) -> Optional[str]:
             capture_output=True,
             text=True,
             check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
         )
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return None
     output = result.stdout.strip()
     return output or None
@@ -399,14 +674,30 @@ def get_gpu_utilization_sample() -> Optional[Dict[str, float]]:
         return None
 
 
-def _nvidia_smi_output() -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _nvidia_smi_banner() -> Optional[str]:
+    # TimeoutExpired propagates, and lru_cache does not cache exceptions, so a hung driver is re-probed.
     try:
-        result = subprocess.run(["nvidia-smi"], capture_output=True, text=True, check=False)
+        result = subprocess.run(
+            ["nvidia-smi"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+        )
     except FileNotFoundError:
         return None
     return result.stdout.strip() or result.stderr.strip() or None
 
 
+def _nvidia_smi_probe() -> Tuple[Optional[str], Optional[str]]:
+    """(nvidia-smi output, error); a timeout yields no output and is reported as the error."""
+    try:
+        return _nvidia_smi_banner(), None
+    except subprocess.TimeoutExpired:
+        return None, f"nvidia-smi timed out after {_NVIDIA_SMI_TIMEOUT_S}s"
+
+
 def _parse_nvidia_smi_versions(raw: Optional[str]) -> Dict[str, Optional[str]]:
     versions = {"driver_version": None, "cuda_version": None}
     if not raw:
@@ -441,44 +732,115 @@ def check_optix_runtime() -> Dict[str, Any]:
     return info
 
 
+def _nvml_first_device() -> Optional[Any]:
+    """Return an NVML handle for GPU 0, or None when pynvml/NVML is unavailable."""
+    try:
+        import pynvml  # pylint: disable=import-error
+
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    try:
+        return pynvml.nvmlDeviceGetHandleByIndex(0)
+    except Exception:
+        # No handle means GpuMonitor.stop() will not shut NVML down, so balance the init here.
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
+        return None
+
+
+def _nvml_utilization_sample(handle: Any) -> Optional[Dict[str, float]]:
+    import pynvml  # pylint: disable=import-error
+
+    try:
+        util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+    except pynvml.NVMLError:
+        return None
+    return {
+        "utilization_pct": float(util.gpu),
+        "memory_used_mb": mem.used / (1024.0 * 1024.0),
+        "memory_total_mb": mem.total / (1024.0 * 1024.0),
+    }
+
+
+_GPU_SAMPLE_KEYS = ("utilization_pct", "memory_used_mb", "memory_total_mb")
+
+
 class GpuMonitor:
+    """Sample GPU utilization in the background.
+
+    Uses NVML through the optional ``pynvml`` bindings when available and
+    falls back to polling ``nvidia-smi`` otherwise.
+    """
+
     def __init__(self, interval_s: float = 0.5) -> None:
         self.interval_s = interval_s
-        self.samples: list[Tuple[float, Dict[str, float]]] = []
+        # One contiguous column per field; missing readings are stored as NaN.
+        self._timestamps = array.array("d")
+        self._columns = {key: array.array("d") for key in _GPU_SAMPLE_KEYS}
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._nvml_handle: Optional[Any] = None
 
     def start(self) -> None:
         if self._thread is not None:
             return
+        self._nvml_handle = _nvml_first_device()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
+    def _sample(self) -> Optional[Dict[str, float]]:
+        if self._nvml_handle is not None:
+            return _nvml_utilization_sample(self._nvml_handle)
+        return get_gpu_utilization_sample()
+
     def _loop(self) -> None:
         while not self._stop.is_set():
-            sample = get_gpu_utilization_sample()
+            sample = self._sample()
             if sample:
-                self.samples.append((time.time(), sample))
+                for key, column in self._columns.items():
+                    column.append(float(sample.get(key, math.nan)))
+                # Timestamps are appended last; their length is the committed sample count.
+                self._timestamps.append(time.time())
             time.sleep(self.interval_s)
 
     def stop(self) -> None:
         self._stop.set()
         if self._thread is not None:
             self._thread.join(timeout=2.0)
+        if self._nvml_handle is not None:
+            self._nvml_handle = None
+            try:
+                import pynvml  # pylint: disable=import-error
+
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
 
     def summary(self) -> Dict[str, Any]:
-        if not self.samples:
+        import numpy as np
+
+        count = len(self._timestamps)
+        if not count:
             return {"samples": 0}
-        utilizations = [s[1]["utilization_pct"] for s in self.samples if "utilization_pct" in s[1]]
-        mem_used = [s[1]["memory_used_mb"] for s in self.samples if "memory_used_mb" in s[1]]
-        mem_total = [s[1]["memory_total_mb"] for s in self.samples if "memory_total_mb" in s[1]]
+
+        def _column_max(key: str) -> Optional[float]:
+            # Slice first: a buffer export of the live array would block appends from _loop.
+            values = np.frombuffer(self._columns[key][:count], dtype=np.float64)
+            if np.isnan(values).all():
+                return None
+            return float(np.nanmax(values))
+
         return {
-            "samples": len(self.samples),
-            "max_utilization_pct": max(utilizations) if utilizations else None,
-            "max_memory_used_mb": max(mem_used) if mem_used else None,
-            "memory_total_mb": max(mem_total) if mem_total else None,
-            "start_time": self.samples[0][0],
-            "end_time": self.samples[-1][0],
+            "samples": count,
+            "max_utilization_pct": _column_max("utilization_pct"),
+            "max_memory_used_mb": _column_max("memory_used_mb"),
+            "memory_total_mb": _column_max("memory_total_mb"),
+            "start_time": self._timestamps[0],
+            "end_time": self._timestamps[count - 1],
         }
 
 
@@ -509,11 +871,11 @@ def gpu_smoke_test(prefer_gpu: bool = True, forced_variant: str = "auto") -> Dic
         result["error"] = f"mitsuba import failed: {exc}"
         return result
 
-    variants = list(mi.variants())
+    variants = list(_mitsuba_variants())
     result["available_variants"] = variants
     selected = None
     if prefer_gpu and forced_variant == "auto":
-        candidate = _preferred_cuda_variant(variants)
+        candidate = _preferred_cuda_variant(_mitsuba_variant_set())
         if candidate:
             try:
                 mi.set_variant(candidate)
@@ -586,14 +948,21 @@ def diagnose_environment(
     tensorflow_mode: str = "auto",
     run_smoke: bool = True,
 ) -> Dict[str, Any]:
-    info = collect_environment_info()
+    # Re-probe the driver once per diagnosis; the cached output is then shared below.
+    info = collect_environment_info(
+        import_tensorflow=tensorflow_mode != "skip",
+        refresh=True,
+        verbose=True,
+    )
     info["diagnose"] = {}
 
     rt_diag: Dict[str, Any] = {}
-    raw_smi = _nvidia_smi_output()
+    raw_smi, smi_error = _nvidia_smi_probe()
     versions = _parse_nvidia_smi_versions(raw_smi)
     rt_diag["nvidia_smi_raw"] = raw_smi
     rt_diag["nvidia_smi_available"] = raw_smi is not None
+    if smi_error:
+        rt_diag["nvidia_smi_error"] = smi_error
     rt_diag["nvidia_driver_version"] = versions["driver_version"]
     rt_diag["driver_version"] = versions["driver_version"]
     rt_diag["cuda_version"] = versions["cuda_version"]
@@ -603,13 +972,13 @@ def diagnose_environment(
     rt_diag["gpu_utilization_sample"] = get_gpu_utilization_sample()
     try:
         import mitsuba as mi
-        variants = list(mi.variants())
+        variants = list(_mitsuba_variants())
         rt_diag["mitsuba_variants"] = variants
         rt_diag["mitsuba_cuda_variants"] = [v for v in variants if "cuda" in v]
-        rt_diag["mitsuba_has_cuda_variant"] = _preferred_cuda_variant(variants) is not None
+        rt_diag["mitsuba_has_cuda_variant"] = _preferred_cuda_variant(_mitsuba_variant_set()) is not None
         selected = None
         if prefer_gpu and forced_variant == "auto":
-            candidate = _preferred_cuda_variant(variants)
+            candidate = _preferred_cuda_variant(_mitsuba_variant_set())
             if candidate:
                 try:
                     mi.set_variant(candidate)
@@ -682,7 +1051,8 @@ def print_diagnose_info(
     output_dir = create_output_dir("outputs")
     info["diagnose"]["output_dir"] = str(output_dir)
     save_json(output_dir / "summary.json", info)
-    print(json.dumps(info, indent=2))
+    json.dump(info, sys.stdout, indent=2)
+    sys.stdout.write("\n")
     if not json_only:
         verdict = info.get("diagnose", {}).get("verdict", "unknown")
         print(verdict)
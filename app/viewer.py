@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import base64
 import csv
+import fnmatch
+import gzip
+import hashlib
 import json
 import logging
 import math
+import os
 import shutil
 import re
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .config import compute_config_hash
+from .io import _json_default, load_radio_map_arrays, radio_map_exists
 from .scene_file_manifest import load_scene_shape_entries
 from .web_assets import ensure_three_vendor
 
@@ -82,106 +90,300 @@ def _format_radio_map_plane_z_token(z_m: float) -> str:
     return f"z{float(z_m):.2f}".replace(".", "p")
 
 
+def _list_plot_names(plot_dir: Path) -> List[str]:
+    """Sorted file names in ``plot_dir``, from a single directory scan."""
+    if not plot_dir.is_dir():
+        return []
+    with os.scandir(plot_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.is_file())
+
+
 def _resolve_primary_radio_map_plot(
-    plot_dir: Path,
+    plot_names: List[str],
     metric_base_name: str,
     *,
     preferred_z_m: float | None = None,
 ) -> Optional[str]:
-    direct = plot_dir / metric_base_name
-    if direct.exists():
+    if metric_base_name in plot_names:
         return metric_base_name
 
     stem = Path(metric_base_name).stem
     if preferred_z_m is not None:
         preferred_name = f"{stem}_{_format_radio_map_plane_z_token(preferred_z_m)}.png"
-        preferred_path = plot_dir / preferred_name
-        if preferred_path.exists():
+        if preferred_name in plot_names:
             return preferred_name
-    matches = sorted(plot_dir.glob(f"{stem}_z*m.png"))
+    matches = [name for name in plot_names if fnmatch.fnmatchcase(name, f"{stem}_z*m.png")]
     if not matches:
         return None
-    return matches[len(matches) // 2].name
+    return matches[len(matches) // 2]
 
 
-def _load_ray_segments(ray_csv: Path) -> List[List[float]]:
-    if not ray_csv.exists():
-        return []
-    data = np.loadtxt(ray_csv, delimiter=",", skiprows=1)
+# dB maps only drive a colormap and hover readouts; 0.01 dB keeps JSON numbers short.
+# Full-precision arrays stay in the run's data/ directory.
+_HEATMAP_JSON_DECIMALS = 2
+
+
+def _heatmap_json_values(values: np.ndarray) -> np.ndarray:
+    return np.round(np.asarray(values, dtype=np.float64), _HEATMAP_JSON_DECIMALS)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy in-kernel with copy_file_range (a reflink on CoW filesystems), else shutil.copyfile."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                while copy_range(in_fd, out_fd, 1 << 30):
+                    pass
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _link_or_copy(src: Path, dst: Path, *, link: bool = True) -> None:
+    """Hardlink ``src`` to ``dst`` (no byte copy on one filesystem), falling back to ``_fast_copy``.
+
+    ``link=False`` always copies, breaking an existing hardlink at ``dst``. An existing
+    separate ``dst`` with the same size and an mtime no older than ``src`` is treated
+    as an up-to-date copy and left alone. Both paths are only stat'ed when ``dst``
+    already exists.
+    """
+    if src == dst:
+        return
+    if os.path.lexists(dst):
+        try:
+            src_st = os.stat(src)
+            dst_st = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            if os.path.samestat(src_st, dst_st):
+                if link:
+                    return
+            elif dst_st.st_size == src_st.st_size and dst_st.st_mtime_ns >= src_st.st_mtime_ns:
+                return
+        dst.unlink()
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    _fast_copy(src, dst)
+
+
+def _json_bytes(data: Any, indent: Optional[int] = None) -> bytes:
+    """Encode viewer JSON, using orjson (numpy arrays serialized in C) when installed."""
+    try:
+        import orjson  # pylint: disable=import-error
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps stdlib parity for int-keyed dicts such as per-path lookups.
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=_json_default)
+    # Compact one-shot json.dumps runs on the C encoder; indent (and json.dump) fall back to pure Python.
+    separators = None if indent else (",", ":")
+    text = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False, default=_json_default)
+    return text.encode("utf-8")
+
+
+def _write_json(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    path.write_bytes(_json_bytes(data, indent=indent))
+
+
+# Above this many ray segments the viewer loads them from segments.f32 instead of inline base64.
+_SEGMENTS_INLINE_MAX = 5000
+
+
+# Ray color ramp endpoints (sRGB hex) and the color modes precomputed next to segments.f32.
+_RAY_RAMP_HEX = (0x2A9D8F, 0xE76F51)
+_RAY_COLOR_METRICS = {"power": "power_linear", "delay": "delay_s"}
+
+
+def _ray_color_ramp() -> np.ndarray:
+    """(256, 3) float32 ramp matching the viewer's three.js LUT (linear working color space)."""
+    srgb = np.array([[(h >> 16) & 255, (h >> 8) & 255, h & 255] for h in _RAY_RAMP_HEX], dtype=np.float64) / 255.0
+    linear = np.where(srgb < 0.04045, srgb * 0.0773993808, (srgb * 0.9478672986 + 0.0521327014) ** 2.4)
+    t = np.arange(256, dtype=np.float64)[:, None] / 255.0
+    return (linear[0] + (linear[1] - linear[0]) * t).astype(np.float32)
+
+
+def _ray_metric_colors(segments: np.ndarray, path_metrics: Dict[str, Any], metric_key: str) -> Optional[np.ndarray]:
+    """Per-vertex RGB (2 vertices per segment) for one path metric, or None without metrics."""
+    path_ids = path_metrics.get("path_id")
+    values = path_metrics.get(metric_key)
+    if path_ids is None or values is None or len(path_ids) == 0 or len(values) == 0 or len(segments) == 0:
+        return None
+    # Later rows win for duplicate path ids, as in the viewer's JS lookup.
+    lookup = dict(zip(map(int, path_ids), map(float, values)))
+    ids = np.fromiter(lookup.keys(), dtype=np.int64, count=len(lookup))
+    vals = np.fromiter(lookup.values(), dtype=np.float64, count=len(lookup))
+    order = np.argsort(ids)
+    ids, vals = ids[order], vals[order]
+    vmin, vmax = float(vals.min()), float(vals.max())
+
+    seg_ids = segments[:, 0].astype(np.int64)
+    pos = np.minimum(np.searchsorted(ids, seg_ids), len(ids) - 1)
+    seg_vals = np.where(ids[pos] == seg_ids, vals[pos], vmin)
+    span = vmax - vmin
+    if span > 0:
+        idx = np.clip(((seg_vals - vmin) / span * 255).astype(np.int64), 0, 255)
+    else:
+        idx = np.zeros(len(seg_vals), dtype=np.int64)
+    return np.repeat(_ray_color_ramp()[idx], 2, axis=0)
+
+
+def _load_ray_segments(ray_csv: Path) -> np.ndarray:
+    """Ray segments as an (N, 7) float64 array of ``path_id, x0, y0, z0, x1, y1, z1``."""
+    # simulate writes ray_paths.npy/.npz next to the CSV; the .npy is memory-mapped, not read.
+    ray_npy = ray_csv.with_suffix(".npy")
+    if ray_npy.exists():
+        try:
+            data = np.load(ray_npy, mmap_mode="r")
+            if data.dtype != np.float64:
+                data = data.astype(np.float64)
+        except Exception as exc:
+            logger.warning("Failed to map %s (%s); falling back to npz/CSV.", ray_npy, exc)
+        else:
+            return data if data.size else np.empty((0, 7))
+    ray_npz = ray_csv.with_suffix(".npz")
+    if ray_npz.exists():
+        try:
+            with np.load(ray_npz) as npz:
+                data = np.asarray(npz["segments"], dtype=np.float64)
+        except Exception as exc:
+            logger.warning("Failed to read %s (%s); falling back to CSV.", ray_npz, exc)
+        else:
+            return data if data.size else np.empty((0, 7))
+    if not ray_csv.exists() or os.path.getsize(ray_csv) == 0:
+        return np.empty((0, 7))
+    data = np.loadtxt(ray_csv, delimiter=",", skiprows=1, dtype=np.float64, ndmin=2)
     if data.size == 0:
-        return []
-    if data.ndim == 1:
-        data = data.reshape(1, -1)
-    return data.tolist()
+        return np.empty((0, 7))
+    return data
+
+
+# paths.csv as (column name -> index, rows); plain lists avoid a dict allocation per row.
+_PathsCsv = Tuple[Dict[str, int], List[List[str]]]
+
+_PATH_TABLE_DEFAULTS = {
+    "path_id": "0",
+    "order": "0",
+    "type": "unknown",
+    "path_length_m": "0.0",
+    "delay_s": "0.0",
+    "power_linear": "0.0",
+    "power_db": "0.0",
+    "interactions": "",
+}
 
 
-def _load_path_metrics(paths_csv: Path) -> Dict[str, Any]:
+def _load_paths_csv(paths_csv: Path) -> _PathsCsv:
     if not paths_csv.exists():
-        return {}
+        return {}, []
     with paths_csv.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # csv.reader yields [] for blank lines, which DictReader used to skip.
+        rows = [row for row in reader if row]
+    return {name: i for i, name in enumerate(header)}, rows
+
+
+def _load_path_metrics(paths_csv: Path, parsed: Optional[_PathsCsv] = None) -> Dict[str, Any]:
+    header, rows = parsed if parsed is not None else _load_paths_csv(paths_csv)
     if not rows:
         return {}
 
     # Support both legacy and extended formats.
-    if "power_linear" in rows[0] and "delay_s" in rows[0]:
+    if "power_linear" in header and "delay_s" in header:
+        # itemgetter transposes the rows in one pass; map() converts each column without per-row lookups.
+        delay_s, power_linear = zip(*map(itemgetter(header["delay_s"], header["power_linear"]), rows))
+        if "path_id" in header:
+            path_id = list(map(int, map(itemgetter(header["path_id"]), rows)))
+        else:
+            path_id = [0] * len(rows)
         return {
-            "path_id": [int(r.get("path_id", 0)) for r in rows],
-            "delay_s": [float(r.get("delay_s", 0.0)) for r in rows],
-            "power_linear": [float(r.get("power_linear", 0.0)) for r in rows],
+            "path_id": path_id,
+            "delay_s": list(map(float, delay_s)),
+            "power_linear": list(map(float, power_linear)),
         }
 
-    data = np.loadtxt(paths_csv, delimiter=",", skiprows=1)
+    if os.path.getsize(paths_csv) == 0:
+        return {}
+    data = np.loadtxt(paths_csv, delimiter=",", skiprows=1, dtype=np.float64, ndmin=2, usecols=range(5))
     if data.size == 0:
         return {}
-    if data.ndim == 1:
-        data = data.reshape(1, -1)
+    # Contiguous float64 columns; the JSON writers serialize them without boxing each value.
+    path_id, delay_s, power_linear, aoa_azimuth_deg, aoa_elevation_deg = np.ascontiguousarray(data.T)
     return {
-        "path_id": data[:, 0].tolist(),
-        "delay_s": data[:, 1].tolist(),
-        "power_linear": data[:, 2].tolist(),
-        "aoa_azimuth_deg": data[:, 3].tolist(),
-        "aoa_elevation_deg": data[:, 4].tolist(),
+        "path_id": path_id,
+        "delay_s": delay_s,
+        "power_linear": power_linear,
+        "aoa_azimuth_deg": aoa_azimuth_deg,
+        "aoa_elevation_deg": aoa_elevation_deg,
     }
 
 
-def _load_path_table(paths_csv: Path) -> List[Dict[str, Any]]:
-    if not paths_csv.exists():
-        return []
-    with paths_csv.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    if not rows:
-        return []
-    if "order" not in rows[0]:
+def _load_path_table(paths_csv: Path, parsed: Optional[_PathsCsv] = None) -> List[Dict[str, Any]]:
+    header, rows = parsed if parsed is not None else _load_paths_csv(paths_csv)
+    if not rows or "order" not in header:
         return []
+    missing = [name for name in _PATH_TABLE_DEFAULTS if name not in header]
+    if missing:
+        # Partial tables: append default cells so every column has an index.
+        header = {**header, **{name: len(header) + i for i, name in enumerate(missing)}}
+        pad = [_PATH_TABLE_DEFAULTS[name] for name in missing]
+        rows = [row + pad for row in rows]
+    i_id, i_order, i_type, i_length, i_delay, i_power, i_power_db, i_interactions = (
+        header[name] for name in _PATH_TABLE_DEFAULTS
+    )
     table = []
+    append = table.append
     for row in rows:
-        interactions = row.get("interactions", "")
-        table.append(
+        interactions = row[i_interactions]
+        append(
             {
-                "path_id": int(row.get("path_id", 0)),
-                "order": int(row.get("order", 0)),
-                "type": row.get("type", "unknown"),
-                "path_length_m": float(row.get("path_length_m", 0.0)),
-                "delay_s": float(row.get("delay_s", 0.0)),
-                "power_linear": float(row.get("power_linear", 0.0)),
-                "power_db": float(row.get("power_db", 0.0)),
-                "interactions": [s for s in interactions.split(";") if s],
+                "path_id": int(row[i_id]),
+                "order": int(row[i_order]),
+                "type": row[i_type],
+                "path_length_m": float(row[i_length]),
+                "delay_s": float(row[i_delay]),
+                "power_linear": float(row[i_power]),
+                "power_db": float(row[i_power_db]),
+                # LoS and other interaction-free rows skip the split entirely.
+                "interactions": [s for s in interactions.split(";") if s] if interactions else [],
             }
         )
     return table
 
 
-def _segments_to_polylines(segments: List[List[float]]) -> Dict[int, List[List[float]]]:
+def _segments_to_polylines(segments: np.ndarray | List[List[float]]) -> Dict[int, List[List[float]]]:
+    """Group segments into per-path polylines, keeping paths in first-seen order.
+
+    Grouping is a stable NumPy sort into one flat point array plus offsets, so
+    Python only does one ``tolist`` and a list slice per path.
+    """
+    seg = np.asarray(segments, dtype=np.float64)
+    if seg.size == 0:
+        return {}
+    seg = seg.reshape(-1, 7)
+    path_ids = seg[:, 0].astype(np.int64)
+    order = np.argsort(path_ids, kind="stable")
+    seg = seg[order]
+    path_ids = path_ids[order]
+    starts = np.flatnonzero(np.r_[True, path_ids[1:] != path_ids[:-1]])
+    points = np.insert(seg[:, 4:7], starts, seg[starts, 1:4], axis=0).tolist()
+    # Path k owns its segments plus one inserted start point, shifting later offsets by k.
+    shift = np.arange(len(starts))
+    begins = (starts + shift).tolist()
+    ends = (np.r_[starts[1:], len(seg)] + shift + 1).tolist()
+    unique_ids = path_ids[starts].tolist()
     polylines: Dict[int, List[List[float]]] = {}
-    for row in segments:
-        path_id = int(row[0])
-        x0, y0, z0, x1, y1, z1 = row[1:]
-        if path_id not in polylines:
-            polylines[path_id] = [[x0, y0, z0]]
-        polylines[path_id].append([x1, y1, z1])
+    for k in np.argsort(order[starts], kind="stable").tolist():
+        polylines[unique_ids[k]] = points[begins[k]:ends[k]]
     return polylines
 
 
@@ -283,17 +485,108 @@ def _write_run_thumbnail(output_dir: Path, viewer_dir: Path, scene: Any = None)
     return None
 
 
+_VIEWER_COPY_MODES = ("link", "copy")
+
+
+def _viewer_copy_links(config: Dict[str, Any]) -> bool:
+    """Whether run artifacts may be hardlinked into viewer/ (``output.viewer_copy_mode``).
+
+    ``link`` shares inodes with ``plots/``, ``data/`` and ``scene_mesh/``, so editing either
+    copy edits both; the default ``copy`` keeps viewer/ independent.
+    """
+    mode = str((config.get("output") or {}).get("viewer_copy_mode", "copy")).lower()
+    if mode not in _VIEWER_COPY_MODES:
+        logger.warning("Unknown output.viewer_copy_mode %r; using 'copy'.", mode)
+        mode = "copy"
+    return mode == "link"
+
+
+_VIEWER_INPUT_DIRS = ("data", "plots", "scene_mesh")
+
+
+def _viewer_input_stamp(output_dir: Path, config: Dict[str, Any]) -> Optional[str]:
+    """Digest of the config plus (name, size, mtime) of every run input; None if the config is unhashable."""
+    try:
+        config_hash = compute_config_hash(config)
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(f"{config_hash}:{_SEGMENTS_INLINE_MAX}".encode("ascii"), digest_size=16)
+    # The page template lives in this module, so editing it must invalidate old viewers too.
+    inputs = [Path(__file__)]
+    scene_cfg = config.get("scene") or {}
+    # The scene XML feeds the manifest's materials and transform_ops, the mesh its geometry.
+    for key in ("file", "mesh"):
+        if scene_cfg.get(key):
+            inputs.append(Path(scene_cfg[key]))
+    for name in _VIEWER_INPUT_DIRS:
+        for root, dirs, files in os.walk(output_dir / name):
+            dirs.sort()
+            inputs.extend(Path(root) / f for f in sorted(files))
+    for path in inputs:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _viewer_outputs(viewer_dir: Path) -> List[str]:
+    """``relpath<TAB>size`` for every file in viewer/ except the stamp itself."""
+    entries = []
+    for root, dirs, files in os.walk(viewer_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            if path == viewer_dir / ".stamp":
+                continue
+            entries.append(f"{path.relative_to(viewer_dir).as_posix()}\t{path.stat().st_size}")
+    return entries
+
+
+def _viewer_stamp_current(viewer_dir: Path, stamp: str) -> bool:
+    """True if ``.stamp`` matches ``stamp`` and every file it lists is still there at its recorded size."""
+    try:
+        recorded = (viewer_dir / ".stamp").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+    if not recorded or recorded[0] != stamp:
+        return False
+    for entry in recorded[1:]:
+        name, _, size = entry.rpartition("\t")
+        try:
+            if os.stat(viewer_dir / name).st_size != int(size):
+                return False
+        except (OSError, ValueError):
+            return False
+    return True
+
+
 def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Optional[Path]:
     viewer_dir = output_dir / "viewer"
     viewer_dir.mkdir(parents=True, exist_ok=True)
     _ensure_vendor(viewer_dir)
 
+    # Without a live scene the viewer is a pure function of the config and run files, so an
+    # unchanged stamp means the existing viewer is current, provided none of its files went
+    # missing or were truncated since. Scene-derived data cannot be stamped.
+    stamp_path = viewer_dir / ".stamp"
+    stamp = _viewer_input_stamp(output_dir, config) if scene is None else None
+    html_path = viewer_dir / "index.html"
+    if stamp is not None and html_path.exists() and _viewer_stamp_current(viewer_dir, stamp):
+        return html_path
+    if stamp_path.exists():
+        stamp_path.unlink()
+
+    link_assets = _viewer_copy_links(config)
     ray_csv = output_dir / "data" / "ray_paths.csv"
     segments = _load_ray_segments(ray_csv)
 
     paths_csv = output_dir / "data" / "paths.csv"
-    path_metrics = _load_path_metrics(paths_csv)
-    path_table = _load_path_table(paths_csv)
+    # One csv.reader pass feeds both the metrics and the per-path table.
+    paths_parsed = _load_paths_csv(paths_csv)
+    path_metrics = _load_path_metrics(paths_csv, parsed=paths_parsed)
+    path_table = _load_path_table(paths_csv, parsed=paths_parsed)
 
     scene_cfg = config.get("scene", {})
     tx = scene_cfg.get("tx", {}).get("position", [0.0, 0.0, 0.0])
@@ -305,8 +598,8 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
         mesh_src = Path(mesh_src)
         if mesh_src.exists():
             mesh_dst = viewer_dir / mesh_src.name
-            if mesh_src.resolve() != mesh_dst.resolve():
-                shutil.copyfile(mesh_src, mesh_dst)
+            # Byte copy, not a hardlink: later edits to the source scene must not alter this run.
+            _link_or_copy(mesh_src, mesh_dst, link=False)
 
     mesh_dir = output_dir / "scene_mesh"
     mesh_files = []
@@ -316,8 +609,7 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
         out_mesh_dir.mkdir(parents=True, exist_ok=True)
         for src in sorted(mesh_dir.glob("*.ply")):
             dst = out_mesh_dir / src.name
-            if src.resolve() != dst.resolve():
-                shutil.copyfile(src, dst)
+            _link_or_copy(src, dst, link=link_assets)
             mesh_files.append(f"meshes/{dst.name}")
         manifest_src = mesh_dir / "mesh_manifest.json"
         if manifest_src.exists():
@@ -330,6 +622,14 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
     proxy = scene_cfg.get("proxy") if proxy_enabled else None
 
     plot_dir = output_dir / "plots"
+    plot_names = _list_plot_names(plot_dir)
+    copied_plots: set[str] = set()
+
+    def _copy_plot(name: str) -> None:
+        if name not in copied_plots:
+            _link_or_copy(plot_dir / name, viewer_dir / name, link=link_assets)
+            copied_plots.add(name)
+
     radio_cfg = config.get("radio_map", {})
     preferred_plane_z = None
     try:
@@ -345,16 +645,13 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
         "radio_map_rx_power_dbm.png",
         "radio_map_path_loss_db.png",
     ]:
-        resolved_name = _resolve_primary_radio_map_plot(plot_dir, base_name, preferred_z_m=preferred_plane_z)
+        resolved_name = _resolve_primary_radio_map_plot(plot_names, base_name, preferred_z_m=preferred_plane_z)
         if resolved_name is None:
             continue
-        src = plot_dir / resolved_name
-        if src.exists():
-            dst = viewer_dir / resolved_name
-            if src.resolve() != dst.resolve():
-                shutil.copyfile(src, dst)
-            overlays.append(resolved_name)
+        _copy_plot(resolved_name)
+        overlays.append(resolved_name)
 
+    segments_path = viewer_dir / "segments.f32"
     data = {
         "segments": segments,
         "path_metrics": path_metrics,
@@ -365,6 +662,40 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
         "proxy": proxy,
         "overlays": overlays,
     }
+    if len(segments) > _SEGMENTS_INLINE_MAX:
+        # Large ray sets go to a little-endian float32 sidecar the page fetches as one ArrayBuffer.
+        segments_path.write_bytes(np.ascontiguousarray(segments, dtype="<f4").tobytes())
+        data["segments"] = []
+        data["segments_url"] = segments_path.name
+        data["segments_count"] = int(len(segments))
+    else:
+        if segments_path.exists():
+            segments_path.unlink()
+        if len(segments):
+            # The same float32 bytes inline: base64 is ~3x smaller than decimal JSON and decodes in one pass.
+            raw = np.ascontiguousarray(segments, dtype="<f4").tobytes()
+            data["segments"] = []
+            data["segments_b64"] = base64.b64encode(raw).decode("ascii")
+            data["segments_count"] = int(len(segments))
+    # Metric-colored vertex buffers ship with the segments (sidecar or inline) so the page only swaps arrays.
+    ray_colors = {}
+    ray_colors_b64 = {}
+    for mode, metric_key in _RAY_COLOR_METRICS.items():
+        colors_path = viewer_dir / f"colors_{mode}.f32"
+        colors = _ray_metric_colors(segments, path_metrics, metric_key)
+        raw = np.ascontiguousarray(colors, dtype="<f4").tobytes() if colors is not None else None
+        if raw is not None and "segments_url" in data:
+            colors_path.write_bytes(raw)
+            ray_colors[mode] = colors_path.name
+            continue
+        if raw is not None:
+            ray_colors_b64[mode] = base64.b64encode(raw).decode("ascii")
+        if colors_path.exists():
+            colors_path.unlink()
+    if ray_colors:
+        data["ray_colors"] = ray_colors
+    if ray_colors_b64:
+        data["ray_colors_b64"] = ray_colors_b64
 
     polylines = _segments_to_polylines(segments)
     path_rows = []
@@ -389,13 +720,16 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
         )
 
     ris_positions = []
-    try:
-        ris_positions = [np.asarray(r.position).reshape(-1).tolist() for r in scene.ris.values()]
-    except Exception:
-        ris_positions = []
+    ris_objects = getattr(scene, "ris", None) if scene is not None else None
+    if ris_objects:
+        try:
+            positions = [np.asarray(r.position, dtype=np.float64).reshape(-1) for r in ris_objects.values()]
+            ris_positions = np.stack(positions).tolist()
+        except Exception:
+            ris_positions = []
     markers = {"tx": tx, "rx": rx, "ris": ris_positions}
-    (viewer_dir / "markers.json").write_text(json.dumps(markers, indent=2), encoding="utf-8")
-    (viewer_dir / "paths.json").write_text(json.dumps(path_rows, indent=2), encoding="utf-8")
+    _write_json(viewer_dir / "markers.json", markers)
+    _write_json(viewer_dir / "paths.json", path_rows)
 
     scene_manifest = {
         "mesh": mesh_dst.name if mesh_dst else None,
@@ -512,19 +846,12 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
             except Exception:
                 materials = []
     scene_manifest["materials"] = materials
-    (viewer_dir / "scene_manifest.json").write_text(
-        json.dumps(scene_manifest, indent=2), encoding="utf-8"
-    )
+    _write_json(viewer_dir / "scene_manifest.json", scene_manifest, indent=2)
 
     heatmap_src = output_dir / "data" / "radio_map.npz"
-    if heatmap_src.exists():
+    if radio_map_exists(heatmap_src):
         try:
-            with np.load(heatmap_src) as hm:
-                rx_power_dbm = hm.get("rx_power_dbm")
-                path_gain_db = hm.get("path_gain_db")
-                cell_centers = hm.get("cell_centers")
-            metric_name = "rx_power_dbm" if rx_power_dbm is not None else "path_gain_db"
-            values = rx_power_dbm if rx_power_dbm is not None else path_gain_db
+            metric_name, values, cell_centers = load_radio_map_arrays(heatmap_src, ("rx_power_dbm", "path_gain_db"))
             if values is not None and cell_centers is not None:
                 if values.ndim == 3:
                     values_out = values[0]
@@ -535,28 +862,23 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
                 heatmap = {
                     "metric": metric_name,
                     "grid_shape": grid_shape,
-                    "values": values_out.tolist(),
-                    "cell_centers": cell_centers.tolist(),
+                    "values": _heatmap_json_values(values_out),
+                    "cell_centers": cell_centers,
                     "center": radio_cfg.get("center"),
                     "size": radio_cfg.get("size"),
                     "cell_size": radio_cfg.get("cell_size"),
                     "orientation": radio_cfg.get("orientation"),
                 }
-                (viewer_dir / "heatmap.json").write_text(
-                    json.dumps(heatmap, indent=2), encoding="utf-8"
-                )
-                heatmap_dst = viewer_dir / "heatmap.npz"
-                if heatmap_dst.resolve() != heatmap_src.resolve():
-                    shutil.copyfile(heatmap_src, heatmap_dst)
+                _write_json(viewer_dir / "heatmap.json", heatmap)
+                if heatmap_src.exists():
+                    _link_or_copy(heatmap_src, viewer_dir / "heatmap.npz", link=link_assets)
         except Exception:
             pass
 
     heatmap_diff_src = output_dir / "data" / "radio_map_diff.npz"
-    if heatmap_diff_src.exists():
+    if radio_map_exists(heatmap_diff_src):
         try:
-            with np.load(heatmap_diff_src) as hm:
-                path_gain_diff_db = hm.get("path_gain_db")
-                cell_centers = hm.get("cell_centers")
+            _, path_gain_diff_db, cell_centers = load_radio_map_arrays(heatmap_diff_src, ("path_gain_db",))
             if path_gain_diff_db is not None and cell_centers is not None:
                 if path_gain_diff_db.ndim == 3:
                     values_out = path_gain_diff_db[0]
@@ -568,55 +890,55 @@ def generate_viewer(output_dir: Path, config: Dict[str, Any], scene=None) -> Opt
                 heatmap_diff = {
                     "metric": "diff_path_gain_db",
                     "grid_shape": grid_shape,
-                    "values": values_out.tolist(),
-                    "cell_centers": cell_centers.tolist(),
+                    "values": _heatmap_json_values(values_out),
+                    "cell_centers": cell_centers,
                     "center": radio_cfg.get("center"),
                     "size": radio_cfg.get("size"),
                     "cell_size": radio_cfg.get("cell_size"),
                     "orientation": radio_cfg.get("orientation"),
                 }
-                (viewer_dir / "heatmap_diff.json").write_text(
-                    json.dumps(heatmap_diff, indent=2), encoding="utf-8"
-                )
-                heatmap_diff_dst = viewer_dir / "heatmap_diff.npz"
-                if heatmap_diff_dst.resolve() != heatmap_diff_src.resolve():
-                    shutil.copyfile(heatmap_diff_src, heatmap_diff_dst)
+                _write_json(viewer_dir / "heatmap_diff.json", heatmap_diff)
+                if heatmap_diff_src.exists():
+                    _link_or_copy(heatmap_diff_src, viewer_dir / "heatmap_diff.npz", link=link_assets)
         except Exception:
             pass
 
     # Collect radio map plot images for UI preview (heatmap or Sionna plots)
     radio_plots = []
-    plots_dir = output_dir / "plots"
-    if plots_dir.exists():
-        for img in sorted(plots_dir.glob("radio_map_*.png"), key=lambda path: _radio_map_plot_priority(path.name)):
-            dst = viewer_dir / img.name
-            if dst.resolve() != img.resolve():
-                shutil.copyfile(img, dst)
-            radio_plots.append({"file": img.name, "label": _radio_map_plot_label(img.name)})
-        for img in sorted(plots_dir.glob("ris_*_phase.png")):
-            dst = viewer_dir / img.name
-            if dst.resolve() != img.resolve():
-                shutil.copyfile(img, dst)
-            radio_plots.append({"file": img.name, "label": img.stem})
-        for img in sorted(plots_dir.glob("ris_*_amplitude.png")):
-            dst = viewer_dir / img.name
-            if dst.resolve() != img.resolve():
-                shutil.copyfile(img, dst)
-            radio_plots.append({"file": img.name, "label": img.stem})
-    (viewer_dir / "radio_map_plots.json").write_text(
-        json.dumps({"plots": radio_plots}, indent=2), encoding="utf-8"
-    )
+    radio_map_names = [name for name in plot_names if fnmatch.fnmatchcase(name, "radio_map_*.png")]
+    for name in sorted(radio_map_names, key=_radio_map_plot_priority):
+        _copy_plot(name)
+        radio_plots.append({"file": name, "label": _radio_map_plot_label(name)})
+    for pattern in ("ris_*_phase.png", "ris_*_amplitude.png"):
+        for name in plot_names:
+            if fnmatch.fnmatchcase(name, pattern):
+                _copy_plot(name)
+                radio_plots.append({"file": name, "label": Path(name).stem})
+    _write_json(viewer_dir / "radio_map_plots.json", {"plots": radio_plots})
     _write_run_thumbnail(output_dir, viewer_dir, scene=scene)
 
     html = build_viewer_html(data)
-    html_path = viewer_dir / "index.html"
-    html_path.write_text(html, encoding="utf-8")
+    html_bytes = html.encode("utf-8")
+    html_path.write_bytes(html_bytes)
+    # Precompressed sibling for static servers that serve .gz variants directly.
+    (viewer_dir / "index.html.gz").write_bytes(gzip.compress(html_bytes, compresslevel=6))
+    if stamp is not None:
+        stamp_path.write_text("\n".join([stamp, *_viewer_outputs(viewer_dir)]) + "\n", encoding="utf-8")
     return html_path
 
 
+def _minify_html(html: str) -> str:
+    """Drop indentation, blank lines and whole-line ``//`` comments; newlines are kept for JS ASI."""
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
 def build_viewer_html(data: Dict[str, Any]) -> str:
-    payload = json.dumps(data)
-    return f"""<!doctype html>
+    payload = _json_bytes(data).decode("utf-8")
+    return _VIEWER_HTML_TEMPLATE.replace("__PAYLOAD__", payload, 1)
+
+
+_VIEWER_HTML_TEMPLATE = _minify_html("""<!doctype html>
 <html>
 <head>
   <meta charset=\"utf-8\" />
@@ -624,9 +946,9 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
   <meta http-equiv=\"Content-Security-Policy\" content=\"default-src 'self' data: blob:; script-src 'self' 'unsafe-eval' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: blob:;\" />
   <title>RIS_SIONNA 3D Viewer</title>
   <style>
-    html, body, #c {{ margin: 0; width: 100%; height: 100%; overflow: hidden; background: #f7f7f2; }}
-    #hud {{ position: absolute; top: 12px; left: 12px; background: rgba(255,255,255,0.9); padding: 8px 10px; font: 12px/1.4 Arial; border-radius: 6px; }}
-    #controls {{ position: absolute; top: 12px; right: 12px; background: rgba(255,255,255,0.9); padding: 8px 10px; font: 12px/1.4 Arial; border-radius: 6px; }}
+    html, body, #c { margin: 0; width: 100%; height: 100%; overflow: hidden; background: #f7f7f2; }
+    #hud { position: absolute; top: 12px; left: 12px; background: rgba(255,255,255,0.9); padding: 8px 10px; font: 12px/1.4 Arial; border-radius: 6px; }
+    #controls { position: absolute; top: 12px; right: 12px; background: rgba(255,255,255,0.9); padding: 8px 10px; font: 12px/1.4 Arial; border-radius: 6px; }
   </style>
 </head>
 <body>
@@ -648,12 +970,12 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
 </div>
 <script type=\"module\">
   import * as THREE from "./vendor/three.module.js";
-  import {{ OrbitControls }} from "./vendor/OrbitControls.js";
+  import { OrbitControls } from "./vendor/OrbitControls.js";
   let GLTFLoader = null;
   let OBJLoader = null;
   let PLYLoader = null;
 
-  const data = {payload};
+  const data = __PAYLOAD__;
   const container = document.getElementById("c");
   const scene = new THREE.Scene();
   scene.background = new THREE.Color(0xf3f6f9);
@@ -661,7 +983,7 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
   const camera = new THREE.PerspectiveCamera(60, window.innerWidth / window.innerHeight, 0.1, 5000);
   camera.up.set(0, 0, 1);
 
-  const renderer = new THREE.WebGLRenderer({{ antialias: true }});
+  const renderer = new THREE.WebGLRenderer({ antialias: true });
   renderer.setSize(window.innerWidth, window.innerHeight);
   container.appendChild(renderer.domElement);
 
@@ -686,96 +1008,143 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
   const meshGroup = new THREE.Group();
   scene.add(meshGroup);
 
-  function registerPickable(obj) {{
+  function registerPickable(obj) {
     if (obj) pickables.push(obj);
-  }}
+  }
 
-  function addProxy(proxy) {{
+  function addProxy(proxy) {
     if (!proxy) return null;
     const proxyGroup = new THREE.Group();
-    if (proxy.ground) {{
+    if (proxy.ground) {
       const size = proxy.ground.size || [200, 200];
       const elev = proxy.ground.elevation || 0;
       const geo = new THREE.PlaneGeometry(size[0], size[1]);
-      const mat = new THREE.MeshStandardMaterial({{ color: 0xdfe7ef, side: THREE.DoubleSide, roughness: 0.9, metalness: 0.0 }});
+      const mat = new THREE.MeshStandardMaterial({ color: 0xdfe7ef, side: THREE.DoubleSide, roughness: 0.9, metalness: 0.0 });
       const ground = new THREE.Mesh(geo, mat);
       ground.position.z = elev;
       proxyGroup.add(ground);
-    }}
-    (proxy.boxes || []).forEach((b, idx) => {{
+    }
+    (proxy.boxes || []).forEach((b, idx) => {
       const size = b.size || [10, 10, 10];
       const center = b.center || [0, 0, size[2] / 2];
       const geo = new THREE.BoxGeometry(size[0], size[1], size[2]);
       const palette = [0x7aa2f7, 0x2ac3de, 0xf6c177, 0xbb9af7];
-      const mat = new THREE.MeshStandardMaterial({{ color: palette[idx % palette.length], transparent: true, opacity: 0.85, roughness: 0.7, metalness: 0.05 }});
+      const mat = new THREE.MeshStandardMaterial({ color: palette[idx % palette.length], transparent: true, opacity: 0.85, roughness: 0.7, metalness: 0.05 });
       const box = new THREE.Mesh(geo, mat);
       box.position.set(center[0], center[1], center[2]);
       proxyGroup.add(box);
       const edges = new THREE.EdgesGeometry(geo);
-      const line = new THREE.LineSegments(edges, new THREE.LineBasicMaterial({{ color: 0x2c3e50, opacity: 0.6, transparent: true }}));
+      const line = new THREE.LineSegments(edges, new THREE.LineBasicMaterial({ color: 0x2c3e50, opacity: 0.6, transparent: true }));
       line.position.copy(box.position);
       proxyGroup.add(line);
-    }});
+    });
     scene.add(proxyGroup);
-    proxyGroup.traverse((child) => {{
+    proxyGroup.traverse((child) => {
       if (child.isMesh) registerPickable(child);
-    }});
+    });
     return proxyGroup;
-  }}
+  }
 
-  function lerpColor(t) {{
+  // 256-step ramp from teal to orange so per-ray coloring is a table lookup.
+  const RAMP_LUT = (() => {
+    const lut = new Float32Array(256 * 3);
     const c1 = new THREE.Color(0x2a9d8f);
     const c2 = new THREE.Color(0xe76f51);
-    return c1.lerp(c2, t);
-  }}
-
-  function buildPathMetricMap(metric) {{
-    const m = data.path_metrics || {{}};
-    if (!m.path_id) return {{}};
-    const map = {{}};
-    for (let i = 0; i < m.path_id.length; i++) {{
-      map[m.path_id[i]] = metric === "delay" ? m.delay_s[i] : m.power_linear[i];
-    }}
-    return map;
-  }}
-
-  function normalizeValues(values) {{
-    const vals = Object.values(values);
-    if (vals.length === 0) return {{ min: 0, max: 1 }};
-    return {{ min: Math.min(...vals), max: Math.max(...vals) }};
-  }}
-
-  function addRays(segments) {{
-    if (!segments || segments.length === 0) return null;
-    const positions = [];
-    const colors = [];
-    const pathIds = [];
+    const c = new THREE.Color();
+    for (let i = 0; i < 256; i++) {
+      c.copy(c1).lerp(c2, i / 255);
+      lut[i * 3] = c.r;
+      lut[i * 3 + 1] = c.g;
+      lut[i * 3 + 2] = c.b;
+    }
+    return lut;
+  })();
+
+  // Metric values indexed directly by (small, non-negative integer) path id; NaN marks missing ids.
+  function buildPathMetricTable(metric) {
+    const m = data.path_metrics || {};
+    const ids = m.path_id || [];
+    const vals = (metric === "delay" ? m.delay_s : m.power_linear) || [];
+    let maxId = -1;
+    let min = Infinity;
+    let max = -Infinity;
+    for (let i = 0; i < ids.length; i++) {
+      if (ids[i] < 0) continue;
+      if (ids[i] > maxId) maxId = ids[i];
+      const v = vals[i];
+      if (v < min) min = v;
+      if (v > max) max = v;
+    }
+    let lookup;
+    // A dense id-indexed table is only worth it while ids are compact; one huge or sparse
+    // legacy path id would otherwise allocate a giant array, so fall back to a Map.
+    if (maxId < 4 * ids.length + 1024) {
+      const table = new Float32Array(maxId + 1).fill(NaN);
+      for (let i = 0; i < ids.length; i++) if (ids[i] >= 0) table[ids[i]] = vals[i];
+      lookup = (id) => (id >= 0 && id < table.length ? table[id] : NaN);
+    } else {
+      const byId = new Map();
+      for (let i = 0; i < ids.length; i++) if (ids[i] >= 0) byId.set(ids[i], vals[i]);
+      lookup = (id) => (byId.has(id) ? byId.get(id) : NaN);
+    }
+    if (min > max) return { lookup, min: 0, max: 1 };
+    return { lookup, min, max };
+  }
+
+  // Little-endian float32 payloads embedded as base64 (segments_b64, ray_colors_b64).
+  function decodeFloat32(b64) {
+    const bin = atob(b64);
+    const bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    return new Float32Array(bytes.buffer);
+  }
+
+  // Segments as one flat Float32Array of [pathId, x0, y0, z0, x1, y1, z1] records.
+  async function loadSegments() {
+    if (data.segments_url) {
+      const res = await fetch(data.segments_url);
+      if (res.ok) return new Float32Array(await res.arrayBuffer());
+      return new Float32Array(0);
+    }
+    if (data.segments_b64) return decodeFloat32(data.segments_b64);
+    return Float32Array.from((data.segments || []).flat());
+  }
+
+  function addRays(flat) {
+    const count = Math.floor(flat.length / 7);
+    if (count === 0) return null;
+    const positions = new Float32Array(count * 6);
+    const colors = new Float32Array(count * 6);
+    const pathIds = new Int32Array(count);
     const defaultColor = new THREE.Color(0xff9750);
-    for (const s of segments) {{
-      const [pathId, x0, y0, z0, x1, y1, z1] = s;
-      positions.push(x0, y0, z0, x1, y1, z1);
-      colors.push(defaultColor.r, defaultColor.g, defaultColor.b);
-      colors.push(defaultColor.r, defaultColor.g, defaultColor.b);
-      pathIds.push(pathId);
-    }}
+    // Plain indexed copies; a subarray view per segment would allocate N short-lived objects.
+    for (let i = 0, o = 0, p = 0; i < count; i++, o += 7, p += 6) {
+      pathIds[i] = flat[o];
+      for (let k = 0; k < 6; k++) positions[p + k] = flat[o + 1 + k];
+    }
+    for (let p = 0; p < colors.length; p += 3) {
+      colors[p] = defaultColor.r;
+      colors[p + 1] = defaultColor.g;
+      colors[p + 2] = defaultColor.b;
+    }
     const geo = new THREE.BufferGeometry();
-    geo.setAttribute("position", new THREE.Float32BufferAttribute(positions, 3));
-    geo.setAttribute("color", new THREE.Float32BufferAttribute(colors, 3));
-    const mat = new THREE.LineBasicMaterial({{ vertexColors: true, transparent: true, opacity: 0.85 }});
+    geo.setAttribute("position", new THREE.BufferAttribute(positions, 3));
+    geo.setAttribute("color", new THREE.BufferAttribute(colors, 3));
+    const mat = new THREE.LineBasicMaterial({ vertexColors: true, transparent: true, opacity: 0.85 });
     const line = new THREE.LineSegments(geo, mat);
     scene.add(line);
-    return {{ line, pathIds }};
-  }}
+    return { line, pathIds };
+  }
 
-  function addMarker(pos, color) {{
+  function addMarker(pos, color) {
     const geo = new THREE.SphereGeometry(2.2, 20, 20);
-    const mat = new THREE.MeshStandardMaterial({{ color, emissive: color, emissiveIntensity: 0.35 }});
+    const mat = new THREE.MeshStandardMaterial({ color, emissive: color, emissiveIntensity: 0.35 });
     const mesh = new THREE.Mesh(geo, mat);
     mesh.position.set(pos[0], pos[1], pos[2]);
     scene.add(mesh);
-  }}
+  }
 
-  function addLabel(pos, text, color) {{
+  function addLabel(pos, text, color) {
     const canvas = document.createElement('canvas');
     const ctx = canvas.getContext('2d');
     ctx.font = '16px Arial';
@@ -789,15 +1158,16 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
     ctx.fillStyle = '#111827';
     ctx.fillText(text, pad, 19);
     const texture = new THREE.CanvasTexture(canvas);
-    const material = new THREE.SpriteMaterial({{ map: texture, depthTest: false }});
+    const material = new THREE.SpriteMaterial({ map: texture, depthTest: false });
     const sprite = new THREE.Sprite(material);
     sprite.scale.set(canvas.width / 6, canvas.height / 6, 1);
     sprite.position.set(pos[0], pos[1], pos[2] + 4);
     scene.add(sprite);
-  }}
+  }
 
   const proxyGroup = addProxy(data.proxy);
-  const rayBundle = addRays(data.segments);
+  const segmentData = await loadSegments();
+  const rayBundle = addRays(segmentData);
   addMarker(data.tx, 0xdc322f);
   addMarker(data.rx, 0x268bd2);
   addLabel(data.tx, "Tx", 0xdc322f);
@@ -805,164 +1175,191 @@ def build_viewer_html(data: Dict[str, Any]) -> str:
   const proxyToggle = document.getElementById("showProxy");
   const meshToggle = document.getElementById("showMesh");
   proxyToggle.checked = false;
-  if (!proxyGroup) {{
+  if (!proxyGroup) {
     proxyToggle.disabled = true;
     proxyToggle.parentElement.style.display = "none";
-  }}
+  }
 
 
   let meshLoaded = false;
-  async function loadPlyMeshes() {{
+  async function loadPlyMeshes() {
     if (!data.mesh_files || data.mesh_files.length === 0) return;
     const mod = await import('./vendor/PLYLoader.js');
     PLYLoader = mod.PLYLoader;
     const loader = new PLYLoader();
-    data.mesh_files.forEach((fname) => {{
-      loader.load(fname, (geom) => {{
+    data.mesh_files.forEach((fname) => {
+      loader.load(fname, (geom) => {
         geom.computeVertexNormals();
-        const mat = new THREE.MeshStandardMaterial({{ color: 0x9aa8b1, transparent: true, opacity: 0.55 }});
+        const mat = new THREE.MeshStandardMaterial({ color: 0x9aa8b1, transparent: true, opacity: 0.55 });
         const mesh = new THREE.Mesh(geom, mat);
         meshGroup.add(mesh);
         registerPickable(mesh);
-      }});
-    }});
-  }}
+      });
+    });
+  }
 
-  async function ensureMeshesLoaded() {{
+  async function ensureMeshesLoaded() {
     if (meshLoaded) return;
     meshLoaded = true;
-    if (data.mesh) {{
+    if (data.mesh) {
       const ext = data.mesh.split('.').pop().toLowerCase();
-      if (ext === 'gltf' || ext === 'glb') {{
+      if (ext === 'gltf' || ext === 'glb') {
         const mod = await import('./vendor/GLTFLoader.js');
         GLTFLoader = mod.GLTFLoader;
         const loader = new GLTFLoader();
-        loader.load(data.mesh, (gltf) => {{
+        loader.load(data.mesh, (gltf) => {
           meshGroup.add(gltf.scene);
-          gltf.scene.traverse((child) => {{
+          gltf.scene.traverse((child) => {
             if (child.isMesh) registerPickable(child);
-          }});
-        }});
-      }} else if (ext === 'obj') {{
+          });
+        });
+      } else if (ext === 'obj') {
         const mod = await import('./vendor/OBJLoader.js');
         OBJLoader = mod.OBJLoader;
         const loader = new OBJLoader();
-        loader.load(data.mesh, (obj) => {{
+        loader.load(data.mesh, (obj) => {
           meshGroup.add(obj);
-          obj.traverse((child) => {{
+          obj.traverse((child) => {
             if (child.isMesh) registerPickable(child);
-          }});
-        }});
-      }}
-    }} else {{
+          });
+        });
+      }
+    } else {
       await loadPlyMeshes();
-    }}
-  }}
-
-  function setCameraToBounds() {{
-    const points = [];
-    for (const s of data.segments || []) {{
-      points.push(new THREE.Vector3(s[1], s[2], s[3]));
-      points.push(new THREE.Vector3(s[4], s[5], s[6]));
-    }}
-    points.push(new THREE.Vector3(data.tx[0], data.tx[1], data.tx[2]));
-    points.push(new THREE.Vector3(data.rx[0], data.rx[1], data.rx[2]));
-    if (points.length === 0) {{
-      camera.position.set(60, 80, 100);
-      controls.target.set(0, 0, 0);
-      return;
-    }}
-    const box = new THREE.Box3().setFromPoints(points);
+    }
+  }
+
+  function setCameraToBounds() {
+    // Tx/Rx seed the box; ray endpoints are scanned straight off the typed array without Vector3s.
+    const box = new THREE.Box3();
+    box.expandByPoint(new THREE.Vector3(data.tx[0], data.tx[1], data.tx[2]));
+    box.expandByPoint(new THREE.Vector3(data.rx[0], data.rx[1], data.rx[2]));
+    const lo = box.min;
+    const hi = box.max;
+    for (let o = 0; o + 7 <= segmentData.length; o += 7) {
+      for (let k = o + 1; k < o + 7; k += 3) {
+        const x = segmentData[k], y = segmentData[k + 1], z = segmentData[k + 2];
+        if (x < lo.x) lo.x = x;
+        if (x > hi.x) hi.x = x;
+        if (y < lo.y) lo.y = y;
+        if (y > hi.y) hi.y = y;
+        if (z < lo.z) lo.z = z;
+        if (z > hi.z) hi.z = z;
+      }
+    }
     const center = box.getCenter(new THREE.Vector3());
     const size = box.getSize(new THREE.Vector3());
     const radius = Math.max(size.x, size.y, size.z) * 0.9 + 10;
     camera.position.set(center.x + radius, center.y + radius, center.z + radius);
     controls.target.copy(center);
     camera.lookAt(center);
-  }}
+  }
+
+  const rayColorCache = {};
+  async function loadRayColors(mode) {
+    const inline = (data.ray_colors_b64 || {})[mode];
+    if (inline && !(mode in rayColorCache)) rayColorCache[mode] = decodeFloat32(inline);
+    const url = (data.ray_colors || {})[mode];
+    if (!url) return rayColorCache[mode] || null;
+    if (!(mode in rayColorCache)) {
+      const res = await fetch(url);
+      rayColorCache[mode] = res.ok ? new Float32Array(await res.arrayBuffer()) : null;
+    }
+    return rayColorCache[mode];
+  }
 
-  function applyRayColors(mode) {{
+  async function applyRayColors(mode) {
     if (!rayBundle || !rayBundle.line) return;
     const colors = rayBundle.line.geometry.getAttribute("color");
-    if (mode === "uniform") {{
+    const arr = colors.array;
+    if (mode === "uniform") {
       const c = new THREE.Color(0xff9750);
-      for (let i = 0; i < colors.count; i++) {{
-        colors.setXYZ(i, c.r, c.g, c.b);
-      }}
+      for (let o = 0; o < arr.length; o += 3) {
+        arr[o] = c.r;
+        arr[o + 1] = c.g;
+        arr[o + 2] = c.b;
+      }
+      colors.needsUpdate = true;
+      return;
+    }
+    const precomputed = await loadRayColors(mode);
+    if (precomputed && precomputed.length === arr.length) {
+      arr.set(precomputed);
       colors.needsUpdate = true;
       return;
-    }}
-    const map = buildPathMetricMap(mode);
-    const bounds = normalizeValues(map);
-    for (let i = 0; i < rayBundle.pathIds.length; i++) {{
-      const pathId = rayBundle.pathIds[i];
-      const val = map[pathId] ?? bounds.min;
-      const t = bounds.max > bounds.min ? (val - bounds.min) / (bounds.max - bounds.min) : 0.0;
-      const c = lerpColor(t);
-      colors.setXYZ(i * 2, c.r, c.g, c.b);
-      colors.setXYZ(i * 2 + 1, c.r, c.g, c.b);
-    }}
+    }
+    const { lookup, min, max } = buildPathMetricTable(mode);
+    const span = max - min;
+    for (let i = 0; i < rayBundle.pathIds.length; i++) {
+      let val = lookup(rayBundle.pathIds[i]);
+      if (val !== val) val = min;
+      const idx = span > 0 ? Math.min(255, Math.max(0, ((val - min) / span * 255) | 0)) * 3 : 0;
+      const o = i * 6;
+      arr[o] = arr[o + 3] = RAMP_LUT[idx];
+      arr[o + 1] = arr[o + 4] = RAMP_LUT[idx + 1];
+      arr[o + 2] = arr[o + 5] = RAMP_LUT[idx + 2];
+    }
     colors.needsUpdate = true;
-  }}
+  }
 
-  document.getElementById("colorMode").addEventListener("change", (e) => {{
+  document.getElementById("colorMode").addEventListener("change", (e) => {
     applyRayColors(e.target.value);
-  }});
-  document.getElementById("showProxy").addEventListener("change", (e) => {{
+  });
+  document.getElementById("showProxy").addEventListener("change", (e) => {
     if (proxyGroup) proxyGroup.visible = e.target.checked;
-  }});
-  document.getElementById("showMesh").addEventListener("change", async (e) => {{
+  });
+  document.getElementById("showMesh").addEventListener("change", async (e) => {
     meshGroup.visible = e.target.checked;
-    if (e.target.checked) {{
+    if (e.target.checked) {
       await ensureMeshesLoaded();
-    }}
-  }});
+    }
+  });
   meshGroup.visible = meshToggle.checked;
-  if (meshToggle.checked) {{
+  if (meshToggle.checked) {
     await ensureMeshesLoaded();
-  }}
-  if (!data.mesh && (!data.mesh_files || data.mesh_files.length === 0)) {{
+  }
+  if (!data.mesh && (!data.mesh_files || data.mesh_files.length === 0)) {
     meshToggle.checked = false;
     meshToggle.disabled = true;
     meshToggle.parentElement.style.display = "none";
-  }}
+  }
   setCameraToBounds();
   controls.update();
   applyRayColors("uniform");
 
-  function animate() {{
+  function animate() {
     requestAnimationFrame(animate);
     controls.update();
     renderer.render(scene, camera);
-  }}
+  }
   animate();
 
-  function updateCoords(event) {{
+  function updateCoords(event) {
     const rect = renderer.domElement.getBoundingClientRect();
     mouse.x = ((event.clientX - rect.left) / rect.width) * 2 - 1;
     mouse.y = -((event.clientY - rect.top) / rect.height) * 2 + 1;
     raycaster.setFromCamera(mouse, camera);
     let point = null;
-    if (pickables.length) {{
+    if (pickables.length) {
       const hits = raycaster.intersectObjects(pickables, true);
       if (hits.length > 0) point = hits[0].point;
-    }}
-    if (!point) {{
+    }
+    if (!point) {
       point = new THREE.Vector3();
       raycaster.ray.intersectPlane(groundPlane, point);
-    }}
-    if (point) {{
-      coordsEl.textContent = `x: ${{point.x.toFixed(2)}} y: ${{point.y.toFixed(2)}} z: ${{point.z.toFixed(2)}}`;
-    }}
-  }}
+    }
+    if (point) {
+      coordsEl.textContent = `x: ${point.x.toFixed(2)} y: ${point.y.toFixed(2)} z: ${point.z.toFixed(2)}`;
+    }
+  }
 
   renderer.domElement.addEventListener('mousemove', updateCoords);
 
-  window.addEventListener('resize', () => {{
+  window.addEventListener('resize', () => {
     camera.aspect = window.innerWidth / window.innerHeight;
     camera.updateProjectionMatrix();
     renderer.setSize(window.innerWidth, window.innerHeight);
-  }});
+  });
 </script>
 </body>
-</html>"""
+</html>""")
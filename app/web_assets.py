@@ -1,49 +1,63 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
 from pathlib import Path
+import re
 import shutil
 import urllib.request
 
 
+_LOCAL_VENDOR = Path(__file__).resolve().parent / "sim_web" / "vendor"
+
+_THREE_ASSETS = {
+    "three.module.js": "https://unpkg.com/three@0.161.0/build/three.module.js",
+    "OrbitControls.js": "https://unpkg.com/three@0.161.0/examples/jsm/controls/OrbitControls.js",
+    "GLTFLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/GLTFLoader.js",
+    "OBJLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/OBJLoader.js",
+    "BufferGeometryUtils.js": "https://unpkg.com/three@0.161.0/examples/jsm/utils/BufferGeometryUtils.js",
+    "PLYLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/PLYLoader.js",
+}
+
+# Bare "three" specifiers become relative imports so the vendored modules load without an import map.
+_SPEC_RE = re.compile(
+    r"""from (['"])three\1|three/(?:examples/jsm|addons)/(?:utils|loaders)/(BufferGeometryUtils|PLYLoader)\.js"""
+)
+
+
+def _rewrite_spec(match: re.Match) -> str:
+    quote = match.group(1)
+    if quote:
+        return f"from {quote}./three.module.js{quote}"
+    return f"./{match.group(2)}.js"
+
+
+# The viewer and the sim server both vendor three.js; one download per process serves every root.
+@functools.lru_cache(maxsize=None)
+def _fetch_vendor_asset(name: str, url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        content = resp.read()
+    if name == "three.module.js":
+        return content
+    return _SPEC_RE.sub(_rewrite_spec, content.decode("utf-8")).encode("utf-8")
+
+
+def _install_vendor_asset(name: str, path: Path) -> None:
+    local_path = _LOCAL_VENDOR / name
+    if local_path.exists():
+        shutil.copyfile(local_path, path)
+        return
+    path.write_bytes(_fetch_vendor_asset(name, _THREE_ASSETS[name]))
+
+
 def ensure_three_vendor(root_dir: Path) -> None:
     vendor_dir = root_dir / "vendor"
     vendor_dir.mkdir(parents=True, exist_ok=True)
-    local_vendor = Path(__file__).resolve().parent / "sim_web" / "vendor"
-    assets = {
-        "three.module.js": "https://unpkg.com/three@0.161.0/build/three.module.js",
-        "OrbitControls.js": "https://unpkg.com/three@0.161.0/examples/jsm/controls/OrbitControls.js",
-        "GLTFLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/GLTFLoader.js",
-        "OBJLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/OBJLoader.js",
-        "BufferGeometryUtils.js": "https://unpkg.com/three@0.161.0/examples/jsm/utils/BufferGeometryUtils.js",
-        "PLYLoader.js": "https://unpkg.com/three@0.161.0/examples/jsm/loaders/PLYLoader.js",
-    }
-    for name, url in assets.items():
-        path = vendor_dir / name
-        if path.exists():
-            continue
-        local_path = local_vendor / name
-        if local_path.exists():
-            shutil.copyfile(local_path, path)
-            continue
-        with urllib.request.urlopen(url, timeout=30) as resp:
-            content = resp.read()
-        if name != "three.module.js":
-            text = content.decode("utf-8")
-            text = text.replace("from 'three';", "from './three.module.js';")
-            text = text.replace('from \"three\";', 'from \"./three.module.js\";')
-            text = text.replace("from 'three'", "from './three.module.js'")
-            text = text.replace('from \"three\"', 'from \"./three.module.js\"')
-            text = text.replace(
-                "three/examples/jsm/utils/BufferGeometryUtils.js",
-                "./BufferGeometryUtils.js",
-            )
-            text = text.replace(
-                "three/addons/utils/BufferGeometryUtils.js",
-                "./BufferGeometryUtils.js",
-            )
-            text = text.replace(
-                "three/examples/jsm/loaders/PLYLoader.js",
-                "./PLYLoader.js",
-            )
-            content = text.encode("utf-8")
-        path.write_bytes(content)
+    missing = [name for name in _THREE_ASSETS if not (vendor_dir / name).exists()]
+    if not missing:
+        return
+    # Downloads are pure network waits; fetch them together so a cold start costs one round trip.
+    with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="vendor") as executor:
+        futures = [executor.submit(_install_vendor_asset, name, vendor_dir / name) for name in missing]
+    for future in futures:
+        future.result()
@@ -18,7 +18,7 @@ from app.campaign import (
     run_absorber_sweep,
     run_campaign,
 )
-from app.io import create_output_dir
+from app.io import create_output_dir, save_npy_dir
 
 
 def _write_campaign_config(path: Path, *, base_dir: Path, run_id: str, max_angles_per_job: int) -> None:
@@ -347,6 +347,38 @@ def test_enrich_qub_sample_from_summary_samples_nearest_radio_map_cell(tmp_path:
     assert _qub_rx_power_series_key([row]) == "radio_map_measurement_rx_power_dbm"
 
 
+def test_enrich_qub_sample_from_summary_reads_npy_radio_map_layout(tmp_path: Path) -> None:
+    output_dir = tmp_path / "run"
+    sample_dir = output_dir / "cases" / "case_a" / "sample_a"
+    (sample_dir / "data").mkdir(parents=True)
+    (sample_dir / "summary.json").write_text(
+        json.dumps({"metrics": {"radio_map": [{"label": "default", "plane_center_z_m": 1.5}]}}),
+        encoding="utf-8",
+    )
+    save_npy_dir(
+        sample_dir / "data" / "radio_map",
+        path_gain_db=np.array([[-48.0, -30.0], [-55.0, -40.0]], dtype=np.float32),
+        cell_centers=np.array(
+            [[[0.0, 0.0, 1.5], [0.1, 0.0, 1.5]], [[0.0, 0.1, 1.5], [0.1, 0.1, 1.5]]],
+            dtype=float,
+        ),
+    )
+
+    row = _enrich_qub_sample_from_summary(
+        output_dir,
+        {
+            "case_id": "case_a",
+            "run_id": "sample_a",
+            "measurement_angle_deg": 0.0,
+            "position_x_m": 0.02,
+            "position_y_m": 0.01,
+            "position_z_m": 1.5,
+        },
+    )
+
+    assert row["radio_map_measurement_path_gain_db"] == pytest.approx(-48.0)
+
+
 def test_run_campaign_writes_chunked_summary_and_prunes(monkeypatch, tmp_path: Path) -> None:
     config_path = tmp_path / "campaign.yaml"
     _write_campaign_config(config_path, base_dir=tmp_path / "outputs", run_id="campaign_a", max_angles_per_job=3)
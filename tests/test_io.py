@@ -1,4 +1,18 @@
-from app.io import generate_run_id
+import json
+
+import numpy as np
+import pytest
+
+from app.io import (
+    generate_run_id,
+    load_radio_map_arrays,
+    load_radio_map_members,
+    radio_map_exists,
+    save_csv,
+    save_json_atomic,
+    save_npy_dir,
+    save_npz,
+)
 
 
 def test_generate_run_id_uses_fractional_seconds() -> None:
@@ -11,3 +25,109 @@ def test_generate_run_id_is_unique_across_back_to_back_calls() -> None:
     first = generate_run_id()
     second = generate_run_id()
     assert first != second
+
+
+def test_save_csv_round_trips_through_loadtxt(tmp_path) -> None:
+    data = np.array([[0, 1.0, 2.5, -3.0], [7, 1e-3, 4.0, 123.456789], [8, 2.5e-9, -1.25e-12, 1e6]])
+    out = tmp_path / "rows.csv"
+
+    save_csv(out, data, header="id,a,b,c", fmt=["%d", "%.9g", "%.9g", "%.9g"])
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "id,a,b,c"
+    assert lines[1] == "0,1,2.5,-3"
+    # %g keeps relative precision, so sub-1e-6 values survive instead of rounding to 0.
+    assert np.allclose(np.loadtxt(out, delimiter=",", skiprows=1), data, rtol=1e-9, atol=0.0)
+
+
+def test_save_csv_tiles_column_blocks(tmp_path) -> None:
+    centers = np.arange(30, dtype=float).reshape(10, 3)
+    values = np.linspace(-1.0, 1.0, 10) * 1e-7
+    out = tmp_path / "radio_map.csv"
+
+    save_csv(out, [centers, values], header="x,y,z,v", fmt=["%.9g"] * 4, chunk_rows=3)
+
+    loaded = np.loadtxt(out, delimiter=",", skiprows=1)
+    assert loaded.shape == (10, 4)
+    assert np.allclose(loaded, np.column_stack([centers, values]), rtol=1e-8, atol=0.0)
+
+
+def test_save_csv_writes_header_only_for_empty_data(tmp_path) -> None:
+    out = tmp_path / "empty.csv"
+    save_csv(out, np.zeros((0, 2)), header="a,b", fmt=["%.3f", "%.3f"])
+    assert out.read_text(encoding="utf-8") == "a,b\n"
+
+
+def test_save_json_atomic_replaces_file_without_leftovers(tmp_path) -> None:
+    out = tmp_path / "progress.json"
+    save_json_atomic(out, {"status": "running", "progress": np.float32(0.5)})
+    save_json_atomic(out, {"status": "completed", "progress": 1.0})
+
+    assert json.loads(out.read_text(encoding="utf-8")) == {"status": "completed", "progress": 1.0}
+    assert [p.name for p in tmp_path.iterdir()] == ["progress.json"]
+
+
+@pytest.mark.parametrize("compression", ["none", "deflate"])
+def test_save_npz_round_trips(tmp_path, compression) -> None:
+    out = tmp_path / "radio_map.npz"
+    grid = np.linspace(-90.0, -40.0, 12).reshape(3, 4)
+
+    save_npz(out, compression, path_gain_db=grid)
+
+    with np.load(out) as payload:
+        assert np.array_equal(payload["path_gain_db"], grid)
+
+
+def test_save_npz_rejects_unknown_compression(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        save_npz(tmp_path / "x.npz", "zstd", values=np.zeros(2))
+
+
+def test_save_npy_dir_writes_mmap_loadable_arrays_and_manifest(tmp_path) -> None:
+    out_dir = tmp_path / "radio_map"
+    grid = np.linspace(-90.0, -40.0, 12, dtype=np.float32).reshape(3, 4)
+
+    save_npy_dir(out_dir, path_gain_db=grid, cell_centers=np.zeros((3, 4, 3)))
+
+    loaded = np.load(out_dir / "path_gain_db.npy", mmap_mode="r")
+    assert np.array_equal(loaded, grid)
+    manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["path_gain_db"] == {"dtype": "<f4", "shape": [3, 4]}
+    assert manifest["cell_centers"]["shape"] == [3, 4, 3]
+
+
+@pytest.mark.parametrize("layout", ["npz", "npy"])
+def test_load_radio_map_arrays_reads_either_layout(tmp_path, layout) -> None:
+    npz_path = tmp_path / "radio_map.npz"
+    grid = np.arange(6, dtype=np.float32).reshape(2, 3)
+    centers = np.ones((2, 3, 3))
+    assert not radio_map_exists(npz_path)
+    if layout == "npz":
+        save_npz(npz_path, path_gain_db=grid, cell_centers=centers)
+    else:
+        save_npy_dir(tmp_path / "radio_map", path_gain_db=grid, cell_centers=centers)
+
+    key, values, cell_centers = load_radio_map_arrays(npz_path, ("rx_power_dbm", "path_gain_db"))
+
+    assert radio_map_exists(npz_path)
+    assert key == "path_gain_db"
+    assert np.array_equal(values, grid)
+    assert np.array_equal(cell_centers, centers)
+    assert load_radio_map_arrays(npz_path, ("rx_power_dbm",)) == (None, None, None)
+
+
+@pytest.mark.parametrize("layout", ["npz", "npy"])
+def test_load_radio_map_members_returns_present_keys_in_one_read(tmp_path, layout) -> None:
+    npz_path = tmp_path / "radio_map.npz"
+    grid = np.zeros((2, 3), dtype=np.float32)
+    arrays = dict(path_gain_db=grid, rx_power_dbm=grid + 30.0, cell_centers=np.ones((2, 3, 3)))
+    if layout == "npz":
+        save_npz(npz_path, **arrays)
+    else:
+        save_npy_dir(tmp_path / "radio_map", **arrays)
+
+    members = load_radio_map_members(npz_path, ("cell_centers", "rx_power_dbm", "path_loss_db"))
+
+    assert sorted(members) == ["cell_centers", "rx_power_dbm"]
+    assert np.array_equal(members["rx_power_dbm"], grid + 30.0)
+    assert load_radio_map_members(tmp_path / "missing.npz", ("cell_centers",)) == {}
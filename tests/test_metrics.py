@@ -53,3 +53,16 @@ def test_build_paths_table_handles_zero_path_results() -> None:
     table = build_paths_table(_EmptyPaths(), tx_power_dbm=0.0)
 
     assert table["rows"] == []
+
+
+def test_compute_path_metrics_accepts_real_imag_coefficient_pair() -> None:
+    complex_paths = _FakePaths()
+    complex_paths.a = complex_paths.a * (1.0 + 1.0j)
+    pair_paths = _FakePaths()
+    pair_paths.a = (complex_paths.a.real.copy(), complex_paths.a.imag.copy())
+
+    expected = compute_path_metrics(complex_paths, tx_power_dbm=0.0)
+    metrics = compute_path_metrics(pair_paths, tx_power_dbm=0.0)
+
+    assert np.isclose(metrics["total_path_gain_linear"], 28.0)
+    assert np.isclose(metrics["total_path_gain_linear"], expected["total_path_gain_linear"])
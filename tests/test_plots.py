@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from app.plots import _radio_map_plane_projection, _radio_map_title, plot_radio_map
+from app.plots import (
+    _radio_map_plane_projection,
+    _radio_map_title,
+    plot_radio_map,
+    plot_radio_map_batch,
+    plot_radio_map_raster,
+)
 
 
 def test_radio_map_plane_projection_handles_vertical_slice() -> None:
@@ -52,3 +58,44 @@ def test_plot_radio_map_accepts_specular_guide_path(tmp_path) -> None:
 
     assert png_path.exists()
     assert svg_path.exists()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_plot_radio_map_batch_writes_every_job(tmp_path, max_workers) -> None:
+    centers = np.array(
+        [
+            [[0.0, 0.0, 1.5], [1.0, 0.0, 1.5]],
+            [[0.0, 1.0, 1.5], [1.0, 1.0, 1.5]],
+        ],
+        dtype=float,
+    )
+    metric = np.array([[0.0, 1.0], [2.0, 3.0]], dtype=float)
+    jobs = [
+        dict(
+            metric_map=metric * scale,
+            cell_centers=centers,
+            output_dir=tmp_path,
+            metric_label=label,
+            filename_prefix=prefix,
+        )
+        for scale, label, prefix in (
+            (1.0, "Path gain [dB]", "radio_map_path_gain_db"),
+            (-1.0, "Path loss [dB]", "radio_map_path_loss_db"),
+        )
+    ]
+
+    outputs = plot_radio_map_batch(jobs, max_workers=max_workers)
+
+    assert [png.name for png, _ in outputs] == ["radio_map_path_gain_db.png", "radio_map_path_loss_db.png"]
+    assert all(png.exists() and svg.exists() for png, svg in outputs)
+
+
+def test_plot_radio_map_raster_writes_one_pixel_per_cell(tmp_path) -> None:
+    import matplotlib.image
+
+    grid = np.linspace(-120.0, -60.0, 12, dtype=np.float32).reshape(3, 4)
+    png_path = plot_radio_map_raster(grid, tmp_path, "radio_map_path_gain_db")
+
+    assert png_path == tmp_path / "radio_map_path_gain_db.png"
+    image = matplotlib.image.imread(png_path)
+    assert image.shape[:2] == (3, 4)
@@ -0,0 +1,14 @@
+from app.utils.progress import _NullProgress, progress_steps
+
+
+def test_progress_steps_is_noop_when_not_interactive() -> None:
+    with progress_steps("Simulation", 3, interactive=False) as (progress, task_id):
+        assert isinstance(progress, _NullProgress)
+        progress.update(task_id, description="Build scene")
+        progress.advance(task_id)
+
+
+def test_progress_steps_respects_ci_env(monkeypatch) -> None:
+    monkeypatch.setenv("CI", "true")
+    with progress_steps("Simulation", 1) as (progress, _):
+        assert isinstance(progress, _NullProgress)
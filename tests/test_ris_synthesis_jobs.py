@@ -37,6 +37,8 @@ def test_create_ris_synthesis_job_from_config(monkeypatch, tmp_path) -> None:
         return _DummyProcess()
 
     monkeypatch.setattr("app.sim_jobs.subprocess.Popen", _fake_popen)
+    # Jobs default to a relative outputs/ base_dir; keep them out of the checkout.
+    monkeypatch.chdir(tmp_path)
     manager = JobManager(output_root)
 
     job = manager.create_job({"kind": "ris_synthesis", "config_path": str(config_path)})
@@ -62,6 +64,7 @@ def test_create_ris_synthesis_quantization_job(monkeypatch, tmp_path) -> None:
         return _DummyProcess()
 
     monkeypatch.setattr("app.sim_jobs.subprocess.Popen", _fake_popen)
+    monkeypatch.chdir(tmp_path)
     manager = JobManager(output_root)
 
     job = manager.create_job(
@@ -89,6 +89,8 @@ def test_create_link_level_job_uses_seed_run_config(tmp_path, monkeypatch) -> No
         return _DummyProcess()
 
     monkeypatch.setattr("app.sim_jobs.subprocess.Popen", _fake_popen)
+    # Jobs default to a relative outputs/ base_dir; keep them out of the checkout.
+    monkeypatch.chdir(tmp_path)
     manager = JobManager(output_root)
 
     job = manager.create_job({"kind": "link_level", "seed_type": "run", "seed_run_id": "seed-run"})
@@ -123,6 +125,7 @@ def test_create_link_level_job_from_config_sets_prepare_seed_run(tmp_path, monke
         return _DummyProcess()
 
     monkeypatch.setattr("app.sim_jobs.subprocess.Popen", _fake_popen)
+    monkeypatch.chdir(tmp_path)
     manager = JobManager(output_root)
 
     job = manager.create_job(
@@ -4,7 +4,13 @@ from types import SimpleNamespace
 
 import numpy as np
 
-from app.simulate import _compute_ris_link_probe, _extract_ray_path_segments
+from app.simulate import (
+    _compute_ris_link_probe,
+    _derive_radio_map_metrics,
+    _extract_ray_path_segments,
+    _radio_map_variant_specs,
+    _write_paths_csv,
+)
 
 
 class _FakeTensor:
@@ -137,3 +143,65 @@ def test_extract_ray_path_segments_preserves_original_path_ids() -> None:
     assert export["exported_paths"] == 2
     assert export["filtered_rear_paths"] == 0
     assert np.unique(export["segments"][:, 0]).tolist() == [1.0, 2.0]
+
+
+def test_derive_radio_map_metrics_matches_per_array_reductions() -> None:
+    path_gain = np.array([[1e-6, 1e-9], [0.0, 1e-3]], dtype=np.float32)
+
+    path_gain_db, rx_power_dbm, path_loss_db, stats = _derive_radio_map_metrics(path_gain, 30.0)
+
+    assert path_gain_db.dtype == path_gain.dtype
+    assert np.allclose(path_gain_db, 10.0 * np.log10(path_gain + 1e-12))
+    assert np.allclose(rx_power_dbm, 30.0 + path_gain_db)
+    assert np.allclose(path_loss_db, -path_gain_db)
+    for name, values in (
+        ("path_gain_db", path_gain_db),
+        ("rx_power_dbm", rx_power_dbm),
+        ("path_loss_db", path_loss_db),
+    ):
+        assert np.isclose(stats[f"{name}_min"], float(np.min(values)), atol=1e-4)
+        assert np.isclose(stats[f"{name}_mean"], float(np.mean(values)), atol=1e-4)
+        assert np.isclose(stats[f"{name}_max"], float(np.max(values)), atol=1e-4)
+
+
+def test_write_paths_csv_formats_rows(tmp_path) -> None:
+    rows = [
+        {
+            "path_id": 3,
+            "order": 2,
+            "type": "specular_reflection",
+            "path_length_m": 12.5,
+            "delay_s": 4.2e-8,
+            "power_linear": 1.5e-7,
+            "power_db": -68.239,
+            "interactions": ["specular_reflection", "specular_reflection"],
+        }
+    ]
+
+    out = tmp_path / "paths.csv"
+    _write_paths_csv(out, rows)
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "path_id,order,type,path_length_m,delay_s,power_linear,power_db,interactions"
+    assert lines[1] == (
+        "3,2,specular_reflection,12.500000,4.200000000e-08,1.500000e-07,-68.239,"
+        "specular_reflection;specular_reflection"
+    )
+
+
+def test_radio_map_variant_specs_sanitizes_names_and_keeps_overrides() -> None:
+    specs = _radio_map_variant_specs(
+        {
+            "variants": [
+                {"name": "fine grid", "cell_size": [0.5, 0.5]},
+                {"name": "fine grid", "los": False},
+                {"specular_reflection": False},
+                "not-a-mapping",
+            ]
+        }
+    )
+
+    assert [spec["suffix"] for spec in specs] == ["variant_fine_grid", "variant_fine_grid_1", "variant_2"]
+    assert specs[0]["overrides"] == {"cell_size": [0.5, 0.5]}
+    assert specs[0]["name"] == "fine grid"
+    assert _radio_map_variant_specs({}) == []
@@ -1,3 +1,10 @@
+import json
+import os
+import subprocess
+import time
+
+import pytest
+
 from app.utils.system import _repo_runtime_warnings
 
 
@@ -18,3 +25,369 @@ def test_repo_runtime_warnings_for_numpy_2() -> None:
 def test_repo_runtime_warnings_empty_for_supported_runtime() -> None:
     warnings = _repo_runtime_warnings(python_info=(3, 11, 9), numpy_version="1.26.4")
     assert warnings == []
+
+
+def test_nvidia_smi_queries_are_cached(monkeypatch) -> None:
+    from app.utils import system
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="24576\n", stderr="")
+
+    monkeypatch.setattr(system.subprocess, "run", fake_run)
+    monkeypatch.setattr(system, "_nvml_system_info", lambda: None)
+    system.get_gpu_memory_mb.cache_clear()
+    system._nvidia_smi_banner.cache_clear()
+    try:
+        assert system.get_gpu_memory_mb() == 24576
+        assert system.get_gpu_memory_mb() == 24576
+        system._nvidia_smi_probe()
+        system._nvidia_smi_probe()
+        assert len(calls) == 2
+    finally:
+        system.get_gpu_memory_mb.cache_clear()
+        system._nvidia_smi_banner.cache_clear()
+
+
+def test_start_tensorflow_import_noop_when_skipped_or_loaded(monkeypatch) -> None:
+    import sys
+    import types
+
+    from app.utils.system import start_tensorflow_import
+
+    assert start_tensorflow_import(mode="skip") is None
+    monkeypatch.setitem(sys.modules, "tensorflow", types.ModuleType("tensorflow"))
+    assert start_tensorflow_import(mode="force") is None
+
+
+def test_gpu_monitor_falls_back_to_nvidia_smi_without_nvml(monkeypatch) -> None:
+    from app.utils import system
+
+    sample = {"utilization_pct": 50.0, "memory_used_mb": 1.0, "memory_total_mb": 2.0}
+    monkeypatch.setattr(system, "_nvml_first_device", lambda: None)
+    monkeypatch.setattr(system, "get_gpu_utilization_sample", lambda: sample)
+    monitor = system.GpuMonitor(interval_s=0.01)
+    monitor.start()
+    time.sleep(0.05)
+    monitor.stop()
+    summary = monitor.summary()
+    assert summary["samples"] >= 1
+    assert summary["max_utilization_pct"] == 50.0
+
+
+def test_preferred_cuda_variant_picks_first_available() -> None:
+    from app.utils.system import _preferred_cuda_variant
+
+    assert _preferred_cuda_variant(frozenset({"llvm_ad_rgb", "cuda_ad_rgb", "cuda_ad_mono"})) == "cuda_ad_mono"
+    assert _preferred_cuda_variant(frozenset({"llvm_ad_rgb", "scalar_rgb"})) is None
+
+
+def test_safe_version_matches_importlib_metadata() -> None:
+    import importlib.metadata
+
+    from app.utils.system import _safe_version
+
+    assert _safe_version("numpy") == importlib.metadata.version("numpy")
+    assert _safe_version("PyYAML") == importlib.metadata.version("pyyaml")
+    assert _safe_version("definitely-not-installed-pkg") is None
+
+
+def test_safe_version_is_cached_per_package(monkeypatch) -> None:
+    from app.utils import system
+
+    system._safe_version.cache_clear()
+    calls = []
+
+    def fake_version(pkg):
+        calls.append(pkg)
+        return "9.9"
+
+    monkeypatch.setattr(system.importlib.metadata, "version", fake_version)
+    assert system._safe_version("some-other-pkg") == "9.9"
+    assert system._safe_version("some-other-pkg") == "9.9"
+    assert calls == ["some-other-pkg"]
+    system._safe_version.cache_clear()
+
+
+def test_preferred_cpu_variant_prefers_polarized_llvm() -> None:
+    from app.utils.system import _preferred_cpu_variant
+
+    variants = frozenset({"scalar_rgb", "llvm_ad_rgb", "llvm_ad_mono_polarized"})
+    assert _preferred_cpu_variant(variants) == "llvm_ad_mono_polarized"
+    assert _preferred_cpu_variant(frozenset({"cuda_ad_rgb"})) is None
+
+
+def test_collect_environment_info_skips_cold_tensorflow_import(monkeypatch) -> None:
+    import sys
+
+    from app.utils import system
+
+    monkeypatch.delitem(sys.modules, "tensorflow", raising=False)
+    monkeypatch.setattr(system, "_IS_DARWIN", False)
+    monkeypatch.setattr(system, "_ENV_INFO_CACHE", {"versions": {}, "mitsuba_error": "stub"})
+    info = system.collect_environment_info()
+    assert "tensorflow" not in sys.modules
+    assert "not loaded" in info["tensorflow_error"]
+
+
+def test_collect_environment_info_adds_tf_build_info_only_when_verbose(monkeypatch) -> None:
+    import sys
+    import types
+
+    from app.utils import system
+
+    build_calls = []
+    fake_tf = types.SimpleNamespace(
+        config=types.SimpleNamespace(list_physical_devices=lambda kind: []),
+        sysconfig=types.SimpleNamespace(get_build_info=lambda: build_calls.append(1) or {"cuda_version": "12"}),
+    )
+    monkeypatch.setitem(sys.modules, "tensorflow", fake_tf)
+    monkeypatch.setattr(system, "_IS_DARWIN", False)
+    monkeypatch.setattr(system, "_ENV_INFO_CACHE", {"versions": {}, "mitsuba_error": "stub"})
+
+    info = system.collect_environment_info()
+    assert info["tensorflow_gpus"] == []
+    assert "tensorflow_build" not in info
+    assert build_calls == []
+
+    info = system.collect_environment_info(verbose=True)
+    assert info["tensorflow_build"] == {"cuda_version": "12"}
+    assert system.collect_tensorflow_build_info() == {"cuda_version": "12"}
+
+
+def test_drjit_thread_count_honors_env_override(monkeypatch) -> None:
+    from app.utils.system import _drjit_thread_count
+
+    monkeypatch.setenv("RIS_SIONNA_DRJIT_THREADS", "3")
+    assert _drjit_thread_count() == 3
+    monkeypatch.setenv("RIS_SIONNA_DRJIT_THREADS", "zero")
+    assert _drjit_thread_count() == len(os.sched_getaffinity(0))
+
+
+def test_collect_environment_info_returns_independent_copies(monkeypatch) -> None:
+    from app.utils import system
+
+    monkeypatch.setattr(system, "_ENV_INFO_CACHE", {"versions": {"numpy": "1.26.4"}, "mitsuba_error": "stub"})
+    first = system.collect_environment_info()
+    first["versions"]["numpy"] = "mutated"
+    second = system.collect_environment_info()
+    assert second["versions"]["numpy"] == "1.26.4"
+
+
+def test_gpu_memory_prefers_nvml_over_nvidia_smi(monkeypatch) -> None:
+    from app.utils import system
+
+    def fail_run(cmd, **kwargs):
+        raise AssertionError("nvidia-smi should not be forked when NVML is available")
+
+    monkeypatch.setattr(system.subprocess, "run", fail_run)
+    monkeypatch.setattr(
+        system,
+        "_nvml_system_info",
+        lambda: {"driver_version": "550.54", "cuda_version": "12.4", "gpus": ["GPU"], "memory_total_mb": 8192},
+    )
+    system.get_gpu_memory_mb.cache_clear()
+    try:
+        assert system.get_gpu_memory_mb() == 8192
+    finally:
+        system.get_gpu_memory_mb.cache_clear()
+
+
+def test_static_environment_info_keeps_nvidia_smi_alongside_nvml(monkeypatch) -> None:
+    from app.utils import system
+
+    monkeypatch.setattr(system, "_nvidia_smi_probe", lambda: ("NVIDIA-SMI 550.54", None))
+    monkeypatch.setattr(
+        system,
+        "_nvml_system_info",
+        lambda: {"driver_version": "550.54", "cuda_version": "12.4", "gpus": ["GPU"], "memory_total_mb": 8192},
+    )
+    monkeypatch.setattr(system, "get_gpu_memory_mb", lambda: 8192)
+    monkeypatch.setattr(system, "check_optix_runtime", lambda: {})
+    monkeypatch.setattr(system, "_module_installed", lambda name: False)
+
+    info = system._collect_static_environment_info()
+
+    assert info["nvidia_smi"] == "NVIDIA-SMI 550.54"
+    assert info["nvidia_gpus"] == ["GPU"]
+    assert info["nvidia"] == {"driver_version": "550.54", "cuda_version": "12.4"}
+
+
+def test_disable_pythreejs_import_resolves_any_name(monkeypatch) -> None:
+    import sys
+
+    from app.utils.system import disable_pythreejs_import
+
+    monkeypatch.delitem(sys.modules, "pythreejs", raising=False)
+    disable_pythreejs_import("test")
+    try:
+        from pythreejs import PerspectiveCamera, SomeFutureWidget  # type: ignore[import-not-found]
+
+        assert PerspectiveCamera is SomeFutureWidget
+        assert PerspectiveCamera(fov=45)() is None
+    finally:
+        sys.modules.pop("pythreejs", None)
+
+
+def test_configure_tensorflow_memory_growth_reuses_loaded_module(monkeypatch) -> None:
+    import sys
+    import types
+
+    from app.utils import system
+
+    fake_tf = types.ModuleType("tensorflow")
+    fake_tf.config = types.SimpleNamespace(list_physical_devices=lambda kind: [])
+    monkeypatch.setitem(sys.modules, "tensorflow", fake_tf)
+    monkeypatch.setattr(system, "_IS_DARWIN", False)
+
+    def no_thread(target, name):
+        raise AssertionError("an already-loaded tensorflow must not start an import thread")
+
+    monkeypatch.setattr(system, "_start_daemon_thread", no_thread)
+
+    info = system.configure_tensorflow_memory_growth(mode="force")
+    assert info == {"tf_gpus": []}
+
+
+def test_print_environment_info_streams_json(monkeypatch, capsys) -> None:
+    from app.utils import system
+
+    monkeypatch.setattr(
+        system,
+        "collect_environment_info",
+        lambda **kwargs: {"versions": {"numpy": "1.26.4"}, "in_docker": False},
+    )
+    system.print_environment_info()
+    out = capsys.readouterr().out
+    assert out.endswith("}\n")
+    assert json.loads(out) == {"versions": {"numpy": "1.26.4"}, "in_docker": False}
+
+
+def test_mitsuba_variants_queried_once_per_process(monkeypatch) -> None:
+    import sys
+    import types
+
+    from app.utils import system
+
+    calls = []
+    fake_mi = types.SimpleNamespace(variants=lambda: calls.append(1) or ["scalar_rgb", "llvm_ad_rgb"])
+    monkeypatch.setitem(sys.modules, "mitsuba", fake_mi)
+    system._mitsuba_variants.cache_clear()
+    system._mitsuba_variant_set.cache_clear()
+    try:
+        assert system._mitsuba_variants() == ("scalar_rgb", "llvm_ad_rgb")
+        assert system._mitsuba_variant_set() == frozenset({"scalar_rgb", "llvm_ad_rgb"})
+        assert system._mitsuba_variants() == ("scalar_rgb", "llvm_ad_rgb")
+        assert calls == [1]
+    finally:
+        system._mitsuba_variants.cache_clear()
+        system._mitsuba_variant_set.cache_clear()
+
+
+def test_system_module_resolves_to_one_object_from_every_import_path() -> None:
+    import importlib
+
+    from app import cli, simulate
+    from app.utils import system
+
+    assert importlib.import_module("app.utils.system") is system
+    # Relative imports inside app/ must share the absolute module, and with it the probe caches.
+    assert cli.print_diagnose_info is system.print_diagnose_info
+    assert simulate.collect_environment_info is system.collect_environment_info
+
+
+def test_driver_probes_give_up_after_timeout(monkeypatch) -> None:
+    from app.utils import system
+
+    def hung_run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(system.subprocess, "run", hung_run)
+    monkeypatch.setattr(system, "_query_nvml_system_info", lambda: time.sleep(5))
+    monkeypatch.setattr(system, "_NVML_TIMEOUT_S", 0.05)
+    system._nvml_system_info.cache_clear()
+    system._nvidia_smi_banner.cache_clear()
+    try:
+        start = time.perf_counter()
+        assert system._nvml_system_info() is None
+        raw_smi, smi_error = system._nvidia_smi_probe()
+        assert raw_smi is None and "timed out" in smi_error
+        assert system._run_nvidia_smi_query("memory.total") is None
+        assert time.perf_counter() - start < 1.0
+
+        # The timeout is not cached as output; a responsive driver is picked up on the next probe.
+        monkeypatch.setattr(
+            system.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout="NVIDIA-SMI 550.54", stderr=""),
+        )
+        assert system._nvidia_smi_probe() == ("NVIDIA-SMI 550.54", None)
+    finally:
+        system._nvml_system_info.cache_clear()
+        system._nvidia_smi_banner.cache_clear()
+
+
+def test_disable_pythreejs_import_reuses_one_stub(monkeypatch) -> None:
+    import sys
+
+    from app.utils import system
+
+    monkeypatch.delitem(sys.modules, "pythreejs", raising=False)
+    monkeypatch.setattr(system, "_PYTHREEJS_STUB", None)
+    try:
+        system.disable_pythreejs_import("first")
+        first = sys.modules["pythreejs"]
+        del sys.modules["pythreejs"]
+        system.disable_pythreejs_import("second")
+        assert sys.modules["pythreejs"] is first
+        assert first.__ris_sionna_stub__ == "first"
+    finally:
+        sys.modules.pop("pythreejs", None)
+
+
+def test_tensorflow_probes_short_circuit_when_not_installed(monkeypatch) -> None:
+    import sys
+
+    from app.utils import system
+
+    monkeypatch.delitem(sys.modules, "tensorflow", raising=False)
+    monkeypatch.setattr(system.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(system, "_IS_DARWIN", False)
+    monkeypatch.setattr(system, "_ENV_INFO_CACHE", {"versions": {}, "mitsuba_error": "stub"})
+
+    def no_thread(target, name):
+        raise AssertionError("no import thread should start for a missing package")
+
+    monkeypatch.setattr(system, "_start_daemon_thread", no_thread)
+    info = system.configure_tensorflow_memory_growth(mode="force")
+    assert info == {"tensorflow_import_error": "TensorFlow not installed"}
+    assert system.start_tensorflow_import("force") is None
+    info = system.collect_environment_info(import_tensorflow=True)
+    assert info["tensorflow_error"] == "TensorFlow not installed"
+
+
+@pytest.mark.parametrize("probe", ["_nvml_first_device", "_query_nvml_system_info"])
+def test_nvml_probes_shut_down_when_a_query_fails(monkeypatch, probe) -> None:
+    import sys
+    import types
+
+    from app.utils import system
+
+    calls = []
+
+    def no_device(index):
+        raise RuntimeError("NVML_ERROR_GPU_IS_LOST")
+
+    fake_nvml = types.SimpleNamespace(
+        nvmlInit=lambda: calls.append("init"),
+        nvmlShutdown=lambda: calls.append("shutdown"),
+        nvmlSystemGetCudaDriverVersion=lambda: 12040,
+        nvmlDeviceGetCount=lambda: 1,
+        nvmlDeviceGetHandleByIndex=no_device,
+    )
+    monkeypatch.setitem(sys.modules, "pynvml", fake_nvml)
+
+    assert getattr(system, probe)() is None
+    assert calls == ["init", "shutdown"]
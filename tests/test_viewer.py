@@ -1,6 +1,28 @@
+import base64
+import json
+import sys
 from pathlib import Path
 
-from app.viewer import _radio_map_plot_label, _radio_map_plot_priority, _scene_ris_interaction_names, _write_run_thumbnail
+import numpy as np
+import pytest
+
+from app.viewer import (
+    build_viewer_html,
+    generate_viewer,
+    _link_or_copy,
+    _list_plot_names,
+    _load_path_metrics,
+    _load_path_table,
+    _load_paths_csv,
+    _load_ray_segments,
+    _radio_map_plot_label,
+    _radio_map_plot_priority,
+    _resolve_primary_radio_map_plot,
+    _scene_ris_interaction_names,
+    _segments_to_polylines,
+    _write_json,
+    _write_run_thumbnail,
+)
 
 
 def test_radio_map_plot_priority_prefers_primary_tx_inclusive_maps() -> None:
@@ -97,3 +119,404 @@ def test_scene_ris_interaction_names_uses_ris_object_ids() -> None:
         ris = {"r0": DummyRis(17), "r1": DummyRis(23)}
 
     assert _scene_ris_interaction_names(DummyScene()) == {"object_17", "object_23"}
+
+
+def test_load_ray_segments_prefers_npz_and_falls_back_to_csv(tmp_path: Path) -> None:
+    ray_csv = tmp_path / "ray_paths.csv"
+    ray_csv.write_text("path_id,x0,y0,z0,x1,y1,z1\n3,0,0,0,1,2,3\n", encoding="utf-8")
+    assert _load_ray_segments(ray_csv).tolist() == [[3.0, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0]]
+
+    segments = np.array([[1, 0.5, 0, 0, 1, 1, 1], [1, 1, 1, 1, 2, 2, 2]], dtype=np.float64)
+    np.savez(tmp_path / "ray_paths.npz", segments=segments)
+    np.testing.assert_array_equal(_load_ray_segments(ray_csv), segments)
+    assert _load_ray_segments(tmp_path / "missing.csv").shape == (0, 7)
+
+
+def test_load_ray_segments_memory_maps_npy_twin(tmp_path: Path) -> None:
+    ray_csv = tmp_path / "ray_paths.csv"
+    segments = np.array([[4, 0, 0, 0, 1, 1, 1]], dtype=np.float64)
+    np.savez(tmp_path / "ray_paths.npz", segments=segments * 2)
+    np.save(tmp_path / "ray_paths.npy", segments)
+
+    loaded = _load_ray_segments(ray_csv)
+
+    assert isinstance(loaded, np.memmap)
+    np.testing.assert_array_equal(loaded, segments)
+
+
+def test_load_ray_segments_parses_legacy_csv(tmp_path: Path) -> None:
+    ray_csv = tmp_path / "ray_paths.csv"
+    ray_csv.write_text("path_id,x0,y0,z0,x1,y1,z1\n3,0,0,0,1,2,3\n", encoding="utf-8")
+
+    assert _load_ray_segments(ray_csv).tolist() == [[3.0, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0]]
+
+
+def test_empty_csv_short_circuits_before_any_parser(tmp_path: Path) -> None:
+    ray_csv = tmp_path / "ray_paths.csv"
+    ray_csv.write_bytes(b"")
+
+    assert _load_ray_segments(ray_csv).shape == (0, 7)
+    assert _load_path_metrics(ray_csv, parsed=({"path_id": 0}, [["1"]])) == {}
+
+
+def test_load_path_metrics_reads_legacy_numeric_columns(tmp_path: Path) -> None:
+    paths_csv = tmp_path / "paths.csv"
+    paths_csv.write_text(
+        "path_id,delay,power,az,el\n0,1e-8,0.5,10,-5\n1,2e-8,0.25,20,5\n",
+        encoding="utf-8",
+    )
+
+    metrics = _load_path_metrics(paths_csv)
+
+    assert all(isinstance(col, np.ndarray) and col.flags.c_contiguous for col in metrics.values())
+    assert {key: col.tolist() for key, col in metrics.items()} == {
+        "path_id": [0.0, 1.0],
+        "delay_s": [1e-8, 2e-8],
+        "power_linear": [0.5, 0.25],
+        "aoa_azimuth_deg": [10.0, 20.0],
+        "aoa_elevation_deg": [-5.0, 5.0],
+    }
+
+
+def test_path_loaders_share_pre_parsed_rows(tmp_path: Path) -> None:
+    paths_csv = tmp_path / "paths.csv"
+    paths_csv.write_text(
+        "path_id,order,type,path_length_m,delay_s,power_linear,power_db,interactions\n"
+        "0,0,los,10.0,3.3e-8,1e-6,-60.0,\n"
+        "1,1,specular,12.0,4.0e-8,1e-7,-70.0,wall;floor\n",
+        encoding="utf-8",
+    )
+    parsed = _load_paths_csv(paths_csv)
+    paths_csv.unlink()
+
+    metrics = _load_path_metrics(paths_csv, parsed=parsed)
+    table = _load_path_table(paths_csv, parsed=parsed)
+
+    assert metrics["path_id"] == [0, 1]
+    assert metrics["power_linear"] == [1e-6, 1e-7]
+    assert [row["interactions"] for row in table] == [[], ["wall", "floor"]]
+    assert table[1]["path_length_m"] == 12.0
+    assert _load_paths_csv(paths_csv) == ({}, [])
+
+
+def test_load_path_table_fills_defaults_for_missing_columns(tmp_path: Path) -> None:
+    paths_csv = tmp_path / "paths.csv"
+    paths_csv.write_text("path_id,order,delay_s\n4,2,1e-7\n\n", encoding="utf-8")
+
+    table = _load_path_table(paths_csv)
+
+    assert table == [
+        {
+            "path_id": 4,
+            "order": 2,
+            "type": "unknown",
+            "path_length_m": 0.0,
+            "delay_s": 1e-7,
+            "power_linear": 0.0,
+            "power_db": 0.0,
+            "interactions": [],
+        }
+    ]
+
+
+def test_segments_to_polylines_groups_interleaved_paths_in_first_seen_order() -> None:
+    segments = [
+        [7.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0],
+        [2.0, 5.0, 5.0, 5.0, 6.0, 5.0, 5.0],
+        [7.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+    ]
+
+    polylines = _segments_to_polylines(segments)
+
+    assert _segments_to_polylines(np.asarray(segments)) == polylines
+    assert list(polylines) == [7, 2]
+    assert polylines[7] == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]
+    assert polylines[2] == [[5.0, 5.0, 5.0], [6.0, 5.0, 5.0]]
+
+
+def test_write_json_is_compact_unless_indented(tmp_path: Path) -> None:
+    data = {"label": "Ø", "values": [[1.0, 2.5]]}
+
+    _write_json(tmp_path / "compact.json", data)
+    _write_json(tmp_path / "pretty.json", data, indent=2)
+
+    assert (tmp_path / "compact.json").read_text(encoding="utf-8") == '{"label":"Ø","values":[[1.0,2.5]]}'
+    assert "\n  " in (tmp_path / "pretty.json").read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("disable_orjson", [False, True])
+def test_write_json_serializes_numpy_arrays(tmp_path: Path, monkeypatch, disable_orjson: bool) -> None:
+    if disable_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    values = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    _write_json(tmp_path / "heatmap.json", {"values": values, "grid_shape": list(values.shape)})
+
+    payload = json.loads((tmp_path / "heatmap.json").read_text(encoding="utf-8"))
+    assert payload == {"values": values.tolist(), "grid_shape": [2, 3]}
+
+
+@pytest.mark.parametrize("disable_orjson", [False, True])
+def test_build_viewer_html_embeds_ndarray_segments_and_int_keys(monkeypatch, disable_orjson: bool) -> None:
+    if disable_orjson:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    segments = np.array([[0, 0, 0, 0, 1, 1, 1]], dtype=np.float64)
+
+    html = build_viewer_html({"segments": segments, "by_path": {3: "los"}})
+
+    payload = json.loads(_embedded_payload(html))
+    assert payload == {"segments": segments.tolist(), "by_path": {"3": "los"}}
+
+
+def test_resolve_primary_radio_map_plot_uses_listed_names(tmp_path: Path) -> None:
+    plot_dir = tmp_path / "plots"
+    plot_dir.mkdir()
+    for name in [
+        "radio_map_path_gain_db_z1p50.png",
+        "radio_map_path_gain_db_z1p40m.png",
+        "radio_map_path_gain_db_z1p60m.png",
+        "scene.png",
+    ]:
+        (plot_dir / name).write_bytes(b"png")
+    names = _list_plot_names(plot_dir)
+
+    assert _resolve_primary_radio_map_plot(names, "radio_map_path_gain_db.png", preferred_z_m=1.5) == (
+        "radio_map_path_gain_db_z1p50.png"
+    )
+    assert _resolve_primary_radio_map_plot(names, "radio_map_path_gain_db.png") == "radio_map_path_gain_db_z1p60m.png"
+    assert _resolve_primary_radio_map_plot(names, "radio_map_rx_power_dbm.png") is None
+    assert _list_plot_names(tmp_path / "missing") == []
+
+
+def test_link_or_copy_replaces_stale_destination(tmp_path: Path) -> None:
+    src = tmp_path / "src.png"
+    dst = tmp_path / "dst.png"
+    src.write_bytes(b"new")
+    dst.write_bytes(b"stale")
+
+    _link_or_copy(src, dst)
+    _link_or_copy(src, dst)
+    _link_or_copy(src, src)
+
+    assert dst.read_bytes() == b"new"
+    assert src.read_bytes() == b"new"
+
+    copy_dst = tmp_path / "copy.png"
+    _link_or_copy(src, copy_dst, link=False)
+    assert copy_dst.read_bytes() == b"new"
+    assert not copy_dst.samefile(src)
+
+
+def test_link_or_copy_skips_up_to_date_copies(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from app import viewer
+
+    src = tmp_path / "mesh.ply"
+    dst = tmp_path / "staged.ply"
+    src.write_bytes(b"abc")
+    _link_or_copy(src, dst, link=False)
+    copies = []
+    monkeypatch.setattr(viewer, "_fast_copy", lambda a, b: copies.append(b))
+
+    _link_or_copy(src, dst, link=False)
+    assert copies == []
+
+    os.utime(src, ns=(dst.stat().st_mtime_ns + 10**9,) * 2)
+    _link_or_copy(src, dst, link=False)
+    assert copies == [dst]
+
+
+def test_fast_copy_falls_back_to_copyfile_when_copy_file_range_fails(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from app.viewer import _fast_copy
+
+    src = tmp_path / "mesh.ply"
+    src.write_bytes(b"ply" * 1000)
+    _fast_copy(src, tmp_path / "fast.ply")
+    assert (tmp_path / "fast.ply").read_bytes() == src.read_bytes()
+
+    def _unsupported(*args):
+        raise OSError(38, "Function not implemented")
+
+    monkeypatch.setattr(os, "copy_file_range", _unsupported, raising=False)
+    _fast_copy(src, tmp_path / "slow.ply")
+    assert (tmp_path / "slow.ply").read_bytes() == src.read_bytes()
+
+
+def test_generate_viewer_writes_minified_html_and_gzip_sibling(tmp_path: Path) -> None:
+    import gzip
+
+    html_path = generate_viewer(tmp_path, {"scene": {}})
+
+    html = html_path.read_text(encoding="utf-8")
+    assert html == build_viewer_html(json.loads(_embedded_payload(html)))
+    assert not any(line != line.strip() or line.startswith("//") for line in html.splitlines())
+    assert gzip.decompress((html_path.parent / "index.html.gz").read_bytes()).decode("utf-8") == html
+
+
+def _embedded_payload(html: str) -> str:
+    start = html.index("const data = ") + len("const data = ")
+    return html[start : html.index(";\n", start)]
+
+
+def test_generate_viewer_reads_heatmap_from_npy_layout(tmp_path: Path) -> None:
+    from app.io import save_npy_dir
+
+    values = np.arange(12, dtype=np.float32).reshape(1, 3, 4) - 80.123456
+    centers = np.zeros((3, 4, 3))
+    save_npy_dir(tmp_path / "data" / "radio_map", path_gain_db=values, cell_centers=centers)
+
+    generate_viewer(tmp_path, {"scene": {}})
+
+    heatmap = json.loads((tmp_path / "viewer" / "heatmap.json").read_text(encoding="utf-8"))
+    assert heatmap["metric"] == "path_gain_db"
+    assert heatmap["grid_shape"] == [3, 4]
+    assert heatmap["values"] == np.round(values[0].astype(np.float64), 2).tolist()
+    assert heatmap["values"][0][0] == -80.12
+    assert not (tmp_path / "viewer" / "heatmap.npz").exists()
+
+
+def test_generate_viewer_writes_ris_positions_as_one_batch(tmp_path: Path) -> None:
+    from types import SimpleNamespace
+
+    scene = SimpleNamespace(
+        ris={
+            "ris_a": SimpleNamespace(position=np.array([[1.0], [2.0], [3.0]])),
+            "ris_b": SimpleNamespace(position=[4.0, 5.0, 6.0]),
+        }
+    )
+
+    generate_viewer(tmp_path, {"scene": {}}, scene=scene)
+
+    markers = json.loads((tmp_path / "viewer" / "markers.json").read_text(encoding="utf-8"))
+    assert markers["ris"] == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def test_generate_viewer_moves_large_ray_sets_to_float32_sidecar(tmp_path: Path, monkeypatch) -> None:
+    from app import viewer
+
+    segments = np.array([[0, 0, 0, 0, 1, 1, 1], [0, 1, 1, 1, 2, 2, 2]], dtype=np.float64)
+    (tmp_path / "data").mkdir()
+    np.savez(tmp_path / "data" / "ray_paths.npz", segments=segments)
+    monkeypatch.setattr(viewer, "_SEGMENTS_INLINE_MAX", 1)
+
+    html = generate_viewer(tmp_path, {"scene": {}}).read_text(encoding="utf-8")
+
+    sidecar = tmp_path / "viewer" / "segments.f32"
+    np.testing.assert_array_equal(np.fromfile(sidecar, dtype="<f4").reshape(-1, 7), segments)
+    payload = json.loads(_embedded_payload(html))
+    assert payload["segments"] == []
+    assert payload["segments_url"] == "segments.f32"
+    assert payload["segments_count"] == 2
+
+    monkeypatch.setattr(viewer, "_SEGMENTS_INLINE_MAX", 5000)
+    html = generate_viewer(tmp_path, {"scene": {}}).read_text(encoding="utf-8")
+    assert not sidecar.exists()
+    payload = json.loads(_embedded_payload(html))
+    inline = np.frombuffer(base64.b64decode(payload["segments_b64"]), dtype="<f4").reshape(-1, 7)
+    np.testing.assert_array_equal(inline, segments)
+    assert payload["segments"] == []
+    assert payload["segments_count"] == 2
+
+
+def test_generate_viewer_precomputes_metric_ray_colors_with_sidecar(tmp_path: Path, monkeypatch) -> None:
+    from app import viewer
+
+    segments = np.array(
+        [[0, 0, 0, 0, 1, 1, 1], [1, 1, 1, 1, 2, 2, 2], [2, 2, 2, 2, 3, 3, 3]],
+        dtype=np.float64,
+    )
+    (tmp_path / "data").mkdir()
+    np.savez(tmp_path / "data" / "ray_paths.npz", segments=segments)
+    (tmp_path / "data" / "paths.csv").write_text(
+        "path_id,delay_s,power_linear\n0,1e-7,1.0\n1,3e-7,0.0\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(viewer, "_SEGMENTS_INLINE_MAX", 1)
+
+    html = generate_viewer(tmp_path, {"scene": {}}).read_text(encoding="utf-8")
+
+    payload = json.loads(_embedded_payload(html))
+    assert payload["ray_colors"] == {"power": "colors_power.f32", "delay": "colors_delay.f32"}
+    ramp = viewer._ray_color_ramp()
+    power = np.fromfile(tmp_path / "viewer" / "colors_power.f32", dtype="<f4").reshape(-1, 3)
+    # Two vertices per segment; path 2 has no metrics and falls back to the minimum.
+    np.testing.assert_array_equal(power, ramp[[255, 255, 0, 0, 0, 0]])
+    delay = np.fromfile(tmp_path / "viewer" / "colors_delay.f32", dtype="<f4").reshape(-1, 3)
+    np.testing.assert_array_equal(delay, ramp[[0, 0, 255, 255, 0, 0]])
+
+    monkeypatch.setattr(viewer, "_SEGMENTS_INLINE_MAX", 5000)
+    html = generate_viewer(tmp_path, {"scene": {}}).read_text(encoding="utf-8")
+    assert not (tmp_path / "viewer" / "colors_power.f32").exists()
+    assert not (tmp_path / "viewer" / "colors_delay.f32").exists()
+    payload = json.loads(_embedded_payload(html))
+    assert "ray_colors" not in payload
+    inline_power = np.frombuffer(base64.b64decode(payload["ray_colors_b64"]["power"]), dtype="<f4")
+    np.testing.assert_array_equal(inline_power.reshape(-1, 3), power)
+
+
+@pytest.mark.parametrize("copy_mode, linked", [(None, False), ("link", True), ("copy", False), ("bogus", False)])
+def test_generate_viewer_copy_mode_controls_hardlinks(tmp_path: Path, copy_mode: str, linked: bool) -> None:
+    plot_dir = tmp_path / "plots"
+    plot_dir.mkdir()
+    (plot_dir / "radio_map_path_gain_db.png").write_bytes(b"png")
+
+    # Start from a linked viewer so the copy modes must also break an existing hardlink.
+    generate_viewer(tmp_path, {"scene": {}, "output": {"viewer_copy_mode": "link"}})
+    output = {} if copy_mode is None else {"viewer_copy_mode": copy_mode}
+    generate_viewer(tmp_path, {"scene": {}, "output": output})
+
+    staged = tmp_path / "viewer" / "radio_map_path_gain_db.png"
+    assert staged.read_bytes() == b"png"
+    assert staged.samefile(plot_dir / "radio_map_path_gain_db.png") is linked
+
+
+def test_generate_viewer_reuses_output_until_inputs_change(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from app import viewer
+
+    plot = tmp_path / "plots" / "radio_map_path_gain_db.png"
+    plot.parent.mkdir()
+    plot.write_bytes(b"png")
+    config = {"scene": {}}
+    builds = []
+    real_build = viewer.build_viewer_html
+    monkeypatch.setattr(viewer, "build_viewer_html", lambda data: builds.append(data) or real_build(data))
+
+    html_path = generate_viewer(tmp_path, config)
+    assert generate_viewer(tmp_path, config) == html_path
+    assert len(builds) == 1
+
+    os.utime(plot, ns=(plot.stat().st_mtime_ns + 10**9,) * 2)
+    generate_viewer(tmp_path, config)
+    generate_viewer(tmp_path, {"scene": {}, "radio_map": {"center_z_only": 1.5}})
+    assert len(builds) == 3
+
+    # Editing the scene XML changes materials/transforms without touching the config.
+    scene_xml = tmp_path / "scene.xml"
+    scene_xml.write_text("<scene/>", encoding="utf-8")
+    file_config = {"scene": {"type": "file", "file": str(scene_xml)}}
+    generate_viewer(tmp_path, file_config)
+    generate_viewer(tmp_path, file_config)
+    assert len(builds) == 4
+    os.utime(scene_xml, ns=(scene_xml.stat().st_mtime_ns + 10**9,) * 2)
+    generate_viewer(tmp_path, file_config)
+    assert len(builds) == 5
+
+    # A missing or truncated output forces a rebuild even though the inputs are unchanged.
+    (tmp_path / "viewer" / "paths.json").unlink()
+    generate_viewer(tmp_path, file_config)
+    assert len(builds) == 6
+    (tmp_path / "viewer" / "markers.json").write_bytes(b"{")
+    generate_viewer(tmp_path, file_config)
+    assert len(builds) == 7
+    generate_viewer(tmp_path, file_config)
+    assert len(builds) == 7
+
+    # A live scene feeds data the stamp cannot see, so it always rebuilds and drops the stamp.
+    generate_viewer(tmp_path, config, scene=object())
+    assert len(builds) == 8
+    assert not (tmp_path / "viewer" / ".stamp").exists()
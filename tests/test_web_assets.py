@@ -0,0 +1,82 @@
+import io
+import threading
+from pathlib import Path
+
+from app import web_assets
+
+
+def test_ensure_three_vendor_downloads_missing_assets_concurrently(tmp_path: Path, monkeypatch) -> None:
+    web_assets._fetch_vendor_asset.cache_clear()
+    monkeypatch.setattr(web_assets, "_LOCAL_VENDOR", tmp_path / "no-local-vendor")
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "OBJLoader.js").write_text("cached", encoding="utf-8")
+    fetched = []
+    barrier = threading.Barrier(len(web_assets._THREE_ASSETS) - 1, timeout=5)
+
+    def _urlopen(url, timeout):
+        fetched.append(url)
+        barrier.wait()  # Deadlocks (and times out) unless every download is in flight at once.
+        return io.BytesIO(b"import { Mesh } from 'three';\nimport 'three/addons/utils/BufferGeometryUtils.js';")
+
+    monkeypatch.setattr(web_assets.urllib.request, "urlopen", _urlopen)
+
+    web_assets.ensure_three_vendor(tmp_path)
+
+    assert len(fetched) == len(web_assets._THREE_ASSETS) - 1
+    assert (tmp_path / "vendor" / "OBJLoader.js").read_text(encoding="utf-8") == "cached"
+    assert (tmp_path / "vendor" / "PLYLoader.js").read_text(encoding="utf-8") == (
+        "import { Mesh } from './three.module.js';\nimport './BufferGeometryUtils.js';"
+    )
+    assert b"from 'three'" in (tmp_path / "vendor" / "three.module.js").read_bytes()
+    web_assets._fetch_vendor_asset.cache_clear()
+
+
+def test_ensure_three_vendor_downloads_each_asset_once_per_process(tmp_path: Path, monkeypatch) -> None:
+    web_assets._fetch_vendor_asset.cache_clear()
+    monkeypatch.setattr(web_assets, "_LOCAL_VENDOR", tmp_path / "no-local-vendor")
+    fetched = []
+
+    def _urlopen(url, timeout):
+        fetched.append(url)
+        return io.BytesIO(b"export {};")
+
+    monkeypatch.setattr(web_assets.urllib.request, "urlopen", _urlopen)
+
+    web_assets.ensure_three_vendor(tmp_path / "viewer")
+    web_assets.ensure_three_vendor(tmp_path / "sim_web")
+
+    assert sorted(fetched) == sorted(web_assets._THREE_ASSETS.values())
+    assert (tmp_path / "sim_web" / "vendor" / "PLYLoader.js").read_bytes() == b"export {};"
+    web_assets._fetch_vendor_asset.cache_clear()
+
+
+def test_ensure_three_vendor_prefers_bundled_copies(tmp_path: Path, monkeypatch) -> None:
+    def _urlopen(url, timeout):
+        raise AssertionError(f"unexpected download of {url}")
+
+    monkeypatch.setattr(web_assets.urllib.request, "urlopen", _urlopen)
+
+    web_assets.ensure_three_vendor(tmp_path)
+
+    for name in web_assets._THREE_ASSETS:
+        assert (tmp_path / "vendor" / name).read_bytes() == (web_assets._LOCAL_VENDOR / name).read_bytes()
+
+
+def test_spec_rewrite_matches_every_three_import_form() -> None:
+    source = (
+        'import * as THREE from "three";\n'
+        "import { Vector3 } from 'three'\n"
+        "import { mergeVertices } from 'three/examples/jsm/utils/BufferGeometryUtils.js';\n"
+        "import { PLYLoader } from 'three/examples/jsm/loaders/PLYLoader.js';\n"
+        "import { x } from 'three-mesh-bvh';\n"
+    )
+
+    rewritten = web_assets._SPEC_RE.sub(web_assets._rewrite_spec, source)
+
+    assert rewritten == (
+        'import * as THREE from "./three.module.js";\n'
+        "import { Vector3 } from './three.module.js'\n"
+        "import { mergeVertices } from './BufferGeometryUtils.js';\n"
+        "import { PLYLoader } from './PLYLoader.js';\n"
+        "import { x } from 'three-mesh-bvh';\n"
+    )